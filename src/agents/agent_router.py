@@ -2,6 +2,9 @@
 AgentRouter - Routes queries to appropriate specialized agents with enhanced pattern detection
 """
 
+import re
+from collections import OrderedDict
+
 from ..utils.logging import get_logger
 from ..config.agent_config import AgentConfig, DEFAULT_AGENT_CONFIG
 from .response_models import (
@@ -15,6 +18,30 @@ logger = get_logger(__name__)
 class AgentRouter:
     """Routes queries to appropriate specialized agents with enhanced pattern detection"""
     
+    # Route decisions
+    ROUTE_REPOSITORY_INFO = "repository_info"
+    ROUTE_DIAGRAM = "diagram"
+    ROUTE_RAG = "rag"
+    
+    # Maximum number of normalized questions kept in the route cache
+    ROUTE_CACHE_SIZE = 1024
+    
+    # Simple diagram keywords for routing (not processing), shared by all instances
+    _diagram_keywords = (
+        'diagram', 'mermaid', 'sequence', 'flow', 'flowchart', 'visualize', 
+        'chart', 'visualization', 'interaction', 'architecture'
+    )
+    
+    # Repository info keywords
+    _repo_info_keywords = (
+        'list repositories', 'available repositories', 'what repositories',
+        'which repositories', 'show repositories', 'indexed repositories'
+    )
+    
+    # Keyword sets compiled into single-pass substring matchers
+    _diagram_keywords_re = re.compile('|'.join(map(re.escape, _diagram_keywords)))
+    _repo_info_keywords_re = re.compile('|'.join(map(re.escape, _repo_info_keywords)))
+    
     def __init__(self, rag_agent, diagram_agent, config=None):
         """
         Initialize AgentRouter with enhanced RAG integration
@@ -30,17 +57,8 @@ class AgentRouter:
         # Create a validated copy of the configuration to prevent direct modification
         self.agent_config = (config or DEFAULT_AGENT_CONFIG).copy()
         
-        # Simple diagram keywords for routing (not processing)
-        self._diagram_keywords = [
-            'diagram', 'mermaid', 'sequence', 'flow', 'flowchart', 'visualize', 
-            'chart', 'visualization', 'interaction', 'architecture'
-        ]
-        
-        # Repository info keywords
-        self._repo_info_keywords = [
-            'list repositories', 'available repositories', 'what repositories',
-            'which repositories', 'show repositories', 'indexed repositories'
-        ]
+        # LRU cache of route decisions keyed on the normalized question
+        self._route_cache = OrderedDict()
         
         # Log agent configuration
         logger.info(f"AgentRouter initialized with DiagramAgent: "
@@ -53,13 +71,15 @@ class AgentRouter:
         """Route query to appropriate agent based on content analysis"""
         
         try:
+            route = self._get_route(question)
+            
             # Check for repository information requests
-            if self._is_repository_info_request(question):
+            if route == self.ROUTE_REPOSITORY_INFO:
                 logger.info(f"Routing to repository information: {question[:100]}...")
                 return self._generate_repository_info_response(question)
             
             # Detect diagram requests using simple keyword matching
-            if self._is_diagram_request(question):
+            if route == self.ROUTE_DIAGRAM:
                 logger.info(f"Routing to diagram generation: {question[:100]}...")
                 return self._delegate_to_diagram_agent(question)
             
@@ -76,11 +96,31 @@ class AgentRouter:
                 "AgentRouter"
             )
     
+    def _get_route(self, question: str) -> str:
+        """Return the route for a question, using the bounded LRU route cache"""
+        key = question.strip().lower()
+        route = self._route_cache.get(key)
+        if route is not None:
+            self._route_cache.move_to_end(key)
+            return route
+        
+        # Classify the normalized key so every spelling that shares it gets the same route
+        if self._is_repository_info_request(key):
+            route = self.ROUTE_REPOSITORY_INFO
+        elif self._is_diagram_request(key):
+            route = self.ROUTE_DIAGRAM
+        else:
+            route = self.ROUTE_RAG
+        
+        self._route_cache[key] = route
+        if len(self._route_cache) > self.ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        return route
+    
     def _is_diagram_request(self, question: str) -> bool:
         """Simple diagram request detection using keyword matching and DiagramAgent capability check"""
         # First check simple keywords for fast routing
-        question_lower = question.lower()
-        if any(keyword in question_lower for keyword in self._diagram_keywords):
+        if self._diagram_keywords_re.search(question.lower()):
             return True
         
         # If DiagramAgent is available, use its enhanced detection
@@ -91,8 +131,7 @@ class AgentRouter:
     
     def _is_repository_info_request(self, question: str) -> bool:
         """Detect requests for repository information"""
-        question_lower = question.lower()
-        return any(pattern in question_lower for pattern in self._repo_info_keywords)
+        return self._repo_info_keywords_re.search(question.lower()) is not None
     
     def _generate_repository_info_response(self, query: str) -> AgentResponse:
         """Generate repository information response using available vectorstore data"""
@@ -193,6 +232,9 @@ class AgentRouter:
         # Create a copy of the new configuration
         self.agent_config = new_config.copy()
         
+        # Cached route decisions may no longer apply
+        self._route_cache.clear()
+        
         # Log the configuration update
         logger.info("Configuration updated")
     
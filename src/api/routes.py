@@ -502,22 +502,23 @@ async def index_single_repository_task(repo_url: str, branch: str = "main", file
                 "original_file_count": len(documents)  # Store original file count
             })
         
-        # Process and chunk the documents
-        processed_docs = text_processor.process_documents(documents)
-        
         # Add to vector store
         if not rag_agent:
             raise Exception("RAG agent not initialized")
-            
-        rag_agent.add_documents(processed_docs)
+        
+        # Chunk the documents in batches and store each batch as it is produced
+        chunk_count = 0
+        for processed_docs in text_processor.iter_process_documents(documents):
+            rag_agent.add_documents(processed_docs)
+            chunk_count += len(processed_docs)
         
         # Update repository info
-        indexed_repositories[repo_name].documents_count = len(processed_docs)  # Number of chunks
+        indexed_repositories[repo_name].documents_count = chunk_count  # Number of chunks
         indexed_repositories[repo_name].original_files_count = len(documents)  # Number of original files
         indexed_repositories[repo_name].status = "indexed"
         indexed_repositories[repo_name].last_indexed = datetime.now().isoformat()
         
-        logger.info(f"Successfully indexed {len(processed_docs)} chunks from {len(documents)} files in {repo_url}")
+        logger.info(f"Successfully indexed {chunk_count} chunks from {len(documents)} files in {repo_url}")
         
     except Exception as e:
         logger.error(f"Error indexing repository {repo_url}: {str(e)}")
@@ -5,7 +5,6 @@ This module provides configuration settings for agent routing, including
 agent selection preferences and backward compatibility options.
 """
 
-import copy
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
@@ -71,7 +70,7 @@ class AgentRoutingConfig(BaseModel):
     
     def copy(self) -> 'AgentRoutingConfig':
         """Create a deep copy of the routing configuration"""
-        return copy.deepcopy(self)
+        return self.model_copy(deep=True)
     
     def validate_diagram_agent_preference(self, diagram_agent_available: bool) -> 'AgentRoutingConfig':
         """
@@ -111,7 +110,7 @@ class AgentConfig(BaseModel):
     
     def copy(self) -> 'AgentConfig':
         """Create a deep copy of the agent configuration"""
-        return copy.deepcopy(self)
+        return self.model_copy(deep=True)
     
     def validate_for_router(self, diagram_agent_available: bool) -> 'AgentConfig':
         """
@@ -171,4 +170,12 @@ AGENT_CONFIG_PRESETS = {
         initialize_diagram_agent=True,
         migration_mode=True
     )
-}
\ No newline at end of file
+}
+
+
+def get_agent_config(preset: str = "modern") -> AgentConfig:
+    """Get a copy of the agent configuration for a preset name"""
+    if preset not in AGENT_CONFIG_PRESETS:
+        raise ValueError(f"Invalid preset: {preset}. Valid presets: {list(AGENT_CONFIG_PRESETS.keys())}")
+    
+    return AGENT_CONFIG_PRESETS[preset].copy()
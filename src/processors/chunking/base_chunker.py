@@ -3,7 +3,8 @@ Base abstract chunker class defining the interface for file-specific chunking st
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Callable, Hashable
 from langchain.docstore.document import Document
 
 
@@ -40,14 +41,18 @@ class ChunkMetadata:
         """Convert metadata to dictionary format."""
         metadata = {
             "source": self.source,
-            "file_path": self.file_path,
-            "file_type": self.file_type,
             "chunk_type": self.chunk_type,
-            "language": self.language,
             "contains_documentation": self.contains_documentation
         }
         
-        # Add optional fields if they exist
+        # Add optional fields if they exist; empty values are left out so they
+        # neither overwrite the original document metadata nor bloat stored rows
+        if self.file_path:
+            metadata["file_path"] = self.file_path
+        if self.file_type:
+            metadata["file_type"] = self.file_type
+        if self.language:
+            metadata["language"] = self.language
         if self.symbol_name:
             metadata["symbol_name"] = self.symbol_name
         if self.parent_symbol:
@@ -57,8 +62,8 @@ class ChunkMetadata:
         if self.line_end is not None:
             metadata["line_end"] = self.line_end
             
-        # Add any extra metadata
-        metadata.update(self.extra)
+        # Add any extra metadata that has a value
+        metadata.update((key, value) for key, value in self.extra.items() if value is not None)
         
         return metadata
 
@@ -115,7 +120,12 @@ class BaseChunker(ABC):
         Returns:
             True if this chunker supports the extension
         """
-        return file_extension.lower() in [ext.lower() for ext in self.get_supported_extensions()]
+        return file_extension.lower() in self._supported_extension_set
+    
+    @cached_property
+    def _supported_extension_set(self) -> frozenset:
+        """Lowercased supported extensions, built once per chunker instance."""
+        return frozenset(ext.lower() for ext in self.get_supported_extensions())
     
     def _create_chunk_document(
         self,
@@ -138,21 +148,61 @@ class BaseChunker(ABC):
         Returns:
             Document with combined metadata
         """
-        # Start with original metadata
-        metadata = dict(original_metadata)
-        
-        # Add chunking information
-        metadata.update({
+        # Original metadata, then chunking information, then semantic metadata,
+        # merged into a single dict
+        metadata = {
+            **original_metadata,
             "chunk_index": chunk_index,
             "total_chunks": total_chunks,
-            "chunk_size": len(content)
-        })
-        
-        # Add semantic metadata
-        metadata.update(chunk_metadata.to_dict())
+            "chunk_size": len(content),
+            **chunk_metadata.to_dict()
+        }
         
         return Document(page_content=content, metadata=metadata)
     
+    def _merge_adjacent_groups(
+        self,
+        groups: List[List[Any]],
+        merge_key: Callable[[List[Any]], Optional[Hashable]]
+    ) -> List[List[Any]]:
+        """
+        Greedily pack adjacent element groups into fewer chunks.
+        
+        Neighbouring groups are merged while they share a merge key and the
+        merged content still fits in max_chunk_size, so runs of small siblings
+        (imports, short functions, methods of one class) become one chunk.
+        
+        Args:
+            groups: Element groups in source order; elements must have `content`
+            merge_key: Returns a group's merge key, or None if it must stay separate
+            
+        Returns:
+            List of merged element groups in source order
+        """
+        merged = []
+        current: Optional[List[Any]] = None
+        current_key = None
+        current_size = 0
+        
+        for group in groups:
+            key = merge_key(group) if group else None
+            # Chunk content joins elements with a blank line
+            size = sum(len(element.content) + 2 for element in group)
+            
+            if (current is not None and key is not None and key == current_key
+                    and current_size + size <= self.max_chunk_size):
+                current = current + group
+                current_size += size
+            else:
+                if current is not None:
+                    merged.append(current)
+                current, current_key, current_size = group, key, size
+        
+        if current is not None:
+            merged.append(current)
+        
+        return merged
+    
     def _clean_content(self, content: str) -> str:
         """
         Clean content by removing problematic characters and normalizing whitespace.
@@ -81,20 +81,19 @@ class ChunkingFactory:
         Returns:
             Appropriate chunker instance
         """
-        # Extract file extension
-        if '.' in file_path:
-            extension = '.' + file_path.split('.')[-1].lower()
-        else:
-            extension = ''
+        # Extract file extension without splitting the whole path
+        _, dot, extension = file_path.rpartition('.')
+        extension = '.' + extension.lower() if dot else ''
         
         # Find registered chunker
         chunker = self._chunkers.get(extension)
         
+        # Lazy log arguments: this runs once per document
         if chunker:
-            logger.debug(f"Using {chunker.__class__.__name__} for file {file_path}")
+            logger.debug("Using %s for file %s", chunker.__class__.__name__, file_path)
             return chunker
         else:
-            logger.debug(f"Using fallback chunker for file {file_path} (extension: {extension})")
+            logger.debug("Using fallback chunker for file %s (extension: %s)", file_path, extension)
             return self._fallback_chunker
     
     def chunk_documents(self, documents: List[Document]) -> List[Document]:
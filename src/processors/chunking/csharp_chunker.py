@@ -18,6 +18,30 @@ from ...config.settings import settings
 
 logger = get_logger(__name__)
 
+_BRACE_RE = re.compile(r'[{}]')
+
+
+def _find_block_end(code: str, start: int, depth: int = 0) -> Optional[int]:
+    """
+    Find the end of a brace-delimited block.
+    
+    Args:
+        code: Source code to scan
+        start: Offset to start scanning from
+        depth: Number of braces already open at start
+        
+    Returns:
+        Offset just past the brace that closes the block, or None if it never closes
+    """
+    for match in _BRACE_RE.finditer(code, start):
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return None
+
 
 class CSharpElement(NamedTuple):
     """Represents a C# code element (legacy compatibility)."""
@@ -47,6 +71,37 @@ class CSharpChunker(BaseChunker):
     Falls back to regex-based parsing if tree-sitter parsing fails.
     """
     
+    # C# language patterns, compiled once for all instances
+    using_pattern = re.compile(r'^\s*using\s+[^;]+;', re.MULTILINE)
+    namespace_pattern = re.compile(r'^\s*namespace\s+([^\s{]+)', re.MULTILINE)
+    class_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(abstract|sealed|static)?\s*(class|interface|struct|enum)\s+(\w+)', re.MULTILINE)
+    method_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(static|virtual|override|abstract)?\s*(\w+(?:\[\])?)\s+(\w+)\s*\([^{]*\)\s*{?', re.MULTILINE)
+    property_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(static)?\s*(\w+(?:\[\])?)\s+(\w+)\s*{\s*(get|set)', re.MULTILINE)
+    
+    # Chunk type for the primary semantic element of a chunk
+    CHUNK_TYPE_MAP = {
+        ElementType.USING: "using",
+        ElementType.NAMESPACE: "namespace",
+        ElementType.CLASS: "class",
+        ElementType.INTERFACE: "interface",
+        ElementType.STRUCT: "struct",
+        ElementType.ENUM: "enum",
+        ElementType.METHOD: "method",
+        ElementType.PROPERTY: "property",
+        ElementType.FIELD: "field",
+        ElementType.CONSTRUCTOR: "constructor"
+    }
+    
+    # Element types whose adjacent groups may be packed into one chunk, by category.
+    # Classes, interfaces, structs and enums are left out so each type keeps its own chunk.
+    MERGE_CATEGORIES = {
+        ElementType.USING: "using",
+        ElementType.METHOD: "member",
+        ElementType.PROPERTY: "member",
+        ElementType.FIELD: "member",
+        ElementType.CONSTRUCTOR: "member"
+    }
+    
     def __init__(self, max_chunk_size: int = 2000, chunk_overlap: int = 50, use_advanced_parsing: Optional[bool] = None):
         """
         Initialize C# chunker.
@@ -81,13 +136,6 @@ class CSharpChunker(BaseChunker):
             except Exception as e:
                 logger.warning(f"Failed to initialize C# advanced parser, falling back to regex: {e}")
                 self.use_advanced_parsing = False
-        
-        # C# language patterns
-        self.using_pattern = re.compile(r'^\s*using\s+[^;]+;', re.MULTILINE)
-        self.namespace_pattern = re.compile(r'^\s*namespace\s+([^\s{]+)', re.MULTILINE)
-        self.class_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(abstract|sealed|static)?\s*(class|interface|struct|enum)\s+(\w+)', re.MULTILINE)
-        self.method_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(static|virtual|override|abstract)?\s*(\w+(?:\[\])?)\s+(\w+)\s*\([^{]*\)\s*{?', re.MULTILINE)
-        self.property_pattern = re.compile(r'^\s*(public|private|protected|internal)?\s*(static)?\s*(\w+(?:\[\])?)\s+(\w+)\s*{\s*(get|set)', re.MULTILINE)
     
     def get_supported_extensions(self) -> List[str]:
         """
@@ -158,7 +206,9 @@ class CSharpChunker(BaseChunker):
         
         # Convert semantic elements to chunks
         chunked_documents = []
-        element_groups = self._group_semantic_elements(parse_result.elements)
+        element_groups = self._merge_adjacent_groups(
+            self._group_semantic_elements(parse_result.elements), self._merge_key
+        )
         
         for i, group in enumerate(element_groups):
             chunk_content = self._create_chunk_from_semantic_elements(group, content)
@@ -309,6 +359,23 @@ class CSharpChunker(BaseChunker):
         
         return groups if groups else [[]]
     
+    def _merge_key(self, group: List[SemanticElement]) -> Optional[tuple]:
+        """
+        Get the merge category shared by every element of a group.
+        
+        Args:
+            group: Group of semantic elements
+            
+        Returns:
+            (category, parent name) tuple, or None if the group must stay separate
+        """
+        keys = {(self.MERGE_CATEGORIES.get(e.element_type), e.parent_name) for e in group}
+        if len(keys) != 1:
+            return None
+        
+        key = keys.pop()
+        return key if key[0] else None
+    
     def _create_chunk_from_semantic_elements(self, elements: List[SemanticElement], source_code: str) -> str:
         """
         Create chunk content from semantic elements.
@@ -367,20 +434,7 @@ class CSharpChunker(BaseChunker):
             primary_element = elements[0]
             
             # Determine chunk type based on primary element
-            chunk_type_map = {
-                ElementType.USING: "using",
-                ElementType.NAMESPACE: "namespace",
-                ElementType.CLASS: "class",
-                ElementType.INTERFACE: "interface",
-                ElementType.STRUCT: "struct",
-                ElementType.ENUM: "enum",
-                ElementType.METHOD: "method",
-                ElementType.PROPERTY: "property",
-                ElementType.FIELD: "field",
-                ElementType.CONSTRUCTOR: "constructor"
-            }
-            
-            chunk_type = chunk_type_map.get(primary_element.element_type, "content")
+            chunk_type = self.CHUNK_TYPE_MAP.get(primary_element.element_type, "content")
             
             # Collect all symbol names
             symbol_names = [e.name for e in elements if e.name]
@@ -477,7 +531,8 @@ class CSharpChunker(BaseChunker):
         # Find using statements
         using_lines = []
         for i, line in enumerate(lines, 1):
-            if self.using_pattern.match(line):
+            # Cheap prefix test before running the regex on every line
+            if line.lstrip().startswith('using') and self.using_pattern.match(line):
                 using_lines.append(i)
         
         if using_lines:
@@ -510,12 +565,11 @@ class CSharpChunker(BaseChunker):
             class_name = match.group(4)
             start_line = code[:match.start()].count('\n') + 1
             
-            # Find class body using regex for balanced braces
-            class_body_pattern = re.compile(r'\{(?:[^{}]*|(?R))*\}')
-            class_body_match = class_body_pattern.search(code, match.end())
+            # Find class body by matching balanced braces
+            class_body_end = _find_block_end(code, match.end())
             
-            if class_body_match:
-                class_end = class_body_match.end()
+            if class_body_end is not None:
+                class_end = class_body_end
                 class_content = code[match.start():class_end]
                 end_line = code[:class_end].count('\n') + 1
             else:
@@ -543,17 +597,7 @@ class CSharpChunker(BaseChunker):
             # Simplified method end detection
             method_start = match.end()
             if code[method_start-1:method_start] == '{':
-                brace_count = 1
-                method_end = method_start
-                
-                for i, char in enumerate(code[method_start:], method_start):
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            method_end = i + 1
-                            break
+                method_end = _find_block_end(code, method_start, depth=1) or method_start
                 
                 end_line = code[:method_end].count('\n') + 1
                 method_content = code[match.start():method_end]
@@ -24,6 +24,45 @@ class FallbackChunker(BaseChunker):
     general text content that doesn't have specialized parsing rules.
     """
     
+    # Programming language by file extension
+    LANGUAGE_MAP = {
+        '.py': 'python',
+        '.js': 'javascript',
+        '.ts': 'typescript',
+        '.jsx': 'jsx',
+        '.tsx': 'tsx',
+        '.cs': 'csharp',
+        '.java': 'java',
+        '.c': 'c',
+        '.cpp': 'cpp',
+        '.cc': 'cpp',
+        '.cxx': 'cpp',
+        '.h': 'c',
+        '.hpp': 'cpp',
+        '.md': 'markdown',
+        '.yml': 'yaml',
+        '.yaml': 'yaml',
+        '.json': 'json',
+        '.xml': 'xml',
+        '.html': 'html',
+        '.css': 'css',
+        '.scss': 'scss',
+        '.less': 'less',
+        '.sql': 'sql',
+        '.sh': 'bash',
+        '.ps1': 'powershell',
+        '.rb': 'ruby',
+        '.php': 'php',
+        '.go': 'go',
+        '.rs': 'rust',
+        '.kt': 'kotlin',
+        '.swift': 'swift',
+        '.scala': 'scala',
+        '.r': 'r',
+        '.m': 'matlab',
+        '.pl': 'perl'
+    }
+    
     def __init__(self, max_chunk_size: int = 1000, chunk_overlap: int = 200):
         """
         Initialize fallback chunker.
@@ -132,45 +171,7 @@ class FallbackChunker(BaseChunker):
         Returns:
             Programming language name or 'text' for unknown types
         """
-        language_map = {
-            '.py': 'python',
-            '.js': 'javascript',
-            '.ts': 'typescript',
-            '.jsx': 'jsx',
-            '.tsx': 'tsx',
-            '.cs': 'csharp',
-            '.java': 'java',
-            '.c': 'c',
-            '.cpp': 'cpp',
-            '.cc': 'cpp',
-            '.cxx': 'cpp',
-            '.h': 'c',
-            '.hpp': 'cpp',
-            '.md': 'markdown',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.json': 'json',
-            '.xml': 'xml',
-            '.html': 'html',
-            '.css': 'css',
-            '.scss': 'scss',
-            '.less': 'less',
-            '.sql': 'sql',
-            '.sh': 'bash',
-            '.ps1': 'powershell',
-            '.rb': 'ruby',
-            '.php': 'php',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.kt': 'kotlin',
-            '.swift': 'swift',
-            '.scala': 'scala',
-            '.r': 'r',
-            '.m': 'matlab',
-            '.pl': 'perl'
-        }
-        
-        return language_map.get(file_type.lower(), 'text')
+        return self.LANGUAGE_MAP.get(file_type.lower(), 'text')
     
     def _contains_documentation(self, content: str) -> bool:
         """
@@ -33,6 +33,28 @@ class JavaScriptChunker(BaseChunker):
     Falls back to text-based chunking if tree-sitter parsing fails.
     """
     
+    # Chunk type for the primary semantic element of a chunk
+    CHUNK_TYPE_MAP = {
+        ElementType.IMPORT: "import",
+        ElementType.EXPORT: "export",
+        ElementType.CLASS: "class",
+        ElementType.FUNCTION: "function",
+        ElementType.METHOD: "method",
+        ElementType.VARIABLE: "variable",
+        ElementType.CONSTANT: "constant",
+        ElementType.COMMENT: "comment"
+    }
+    
+    # Element types whose adjacent groups may be packed into one chunk, by category.
+    # Exports are left out so each exported class or function keeps its own chunk.
+    MERGE_CATEGORIES = {
+        ElementType.IMPORT: "import",
+        ElementType.FUNCTION: "declaration",
+        ElementType.VARIABLE: "declaration",
+        ElementType.CONSTANT: "declaration",
+        ElementType.METHOD: "method"
+    }
+    
     def __init__(self, max_chunk_size: int = 1500, chunk_overlap: int = 100, use_advanced_parsing: Optional[bool] = None):
         """
         Initialize JavaScript chunker.
@@ -137,7 +159,9 @@ class JavaScriptChunker(BaseChunker):
         
         # Convert semantic elements to chunks
         chunked_documents = []
-        element_groups = self._group_semantic_elements(parse_result.elements)
+        element_groups = self._merge_adjacent_groups(
+            self._group_semantic_elements(parse_result.elements), self._merge_key
+        )
         
         for i, group in enumerate(element_groups):
             chunk_content = self._create_chunk_from_semantic_elements(group, content)
@@ -245,6 +269,23 @@ class JavaScriptChunker(BaseChunker):
         
         return groups if groups else [[]]
     
+    def _merge_key(self, group: List[SemanticElement]) -> Optional[tuple]:
+        """
+        Get the merge category shared by every element of a group.
+        
+        Args:
+            group: Group of semantic elements
+            
+        Returns:
+            (category, parent name) tuple, or None if the group must stay separate
+        """
+        keys = {(self.MERGE_CATEGORIES.get(e.element_type), e.parent_name) for e in group}
+        if len(keys) != 1:
+            return None
+        
+        key = keys.pop()
+        return key if key[0] else None
+    
     def _create_chunk_from_semantic_elements(self, elements: List[SemanticElement], source_code: str) -> str:
         """
         Create chunk content from semantic elements.
@@ -302,18 +343,7 @@ class JavaScriptChunker(BaseChunker):
             primary_element = elements[0]
             
             # Determine chunk type based on primary element
-            chunk_type_map = {
-                ElementType.IMPORT: "import",
-                ElementType.EXPORT: "export",
-                ElementType.CLASS: "class",
-                ElementType.FUNCTION: "function",
-                ElementType.METHOD: "method",
-                ElementType.VARIABLE: "variable",
-                ElementType.CONSTANT: "constant",
-                ElementType.COMMENT: "comment"
-            }
-            
-            chunk_type = chunk_type_map.get(primary_element.element_type, "content")
+            chunk_type = self.CHUNK_TYPE_MAP.get(primary_element.element_type, "content")
             
             # Collect all symbol names
             symbol_names = [e.name for e in elements if e.name and e.name != "comment"]
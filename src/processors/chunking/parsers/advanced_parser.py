@@ -8,7 +8,7 @@ language-specific parsers.
 
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import tree_sitter as ts
 import threading
 
@@ -21,6 +21,17 @@ from ....utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Tree-sitter languages are immutable, so one is loaded per parser class and shared
+_language_cache: Dict[type, ts.Language] = {}
+_language_lock = threading.Lock()
+
+# Idle parsers per parser class; a parser is taken out for one parse at a time
+_parser_pool: Dict[type, List[ts.Parser]] = {}
+_parser_pool_lock = threading.Lock()
+
+# Comment markers stripped from documentation lines, tried in order
+_COMMENT_PREFIXES = ('//', '///', '/*', '*/', '*', '#')
+
 
 class ParsingError(Exception):
     """Base exception for parsing errors."""
@@ -74,6 +85,10 @@ class AdvancedParser(ABC):
         self.max_recursion_depth = self.config.get('max_recursion_depth', 100)  # Prevent infinite recursion
         self.max_elements_per_file = self.config.get('max_elements_per_file', 1000)  # Prevent memory issues
         
+        # Source text of the last parse and its UTF-8 bytes (None when ASCII, where
+        # byte and character offsets coincide); node text is sliced from these
+        self._encoded_source: Tuple[Optional[str], Optional[bytes]] = (None, None)
+        
         # Performance tracking
         self._parse_count = 0
         self._total_parse_time = 0.0
@@ -85,16 +100,18 @@ class AdvancedParser(ABC):
     def _initialize_parser(self) -> None:
         """Initialize the tree-sitter parser and language."""
         try:
-            # Add timeout protection for language loading
-            self._language = self._get_tree_sitter_language_with_timeout()
+            self._language = _language_cache.get(type(self))
             if not self._language:
-                raise AdvancedParserError("Failed to load tree-sitter language")
+                # Add timeout protection for language loading
+                language = self._get_tree_sitter_language_with_timeout()
+                if not language:
+                    raise AdvancedParserError("Failed to load tree-sitter language")
+                with _language_lock:
+                    self._language = _language_cache.setdefault(type(self), language)
                 
-            self._parser = ts.Parser()
-            try:
-                self._parser.set_language(self._language)
-            except AttributeError:
-                self._parser.language = self._language
+            # Build one parser up front so the pool is warm for the first parse
+            self._parser = self._acquire_parser()
+            self._release_parser(self._parser)
             logger.debug(f"Initialized tree-sitter parser for {self.language_name}")
             
         except Exception as e:
@@ -103,6 +120,30 @@ class AdvancedParser(ABC):
             self._parser = None
             self._language = None
     
+    def _acquire_parser(self) -> ts.Parser:
+        """
+        Take an idle pooled tree-sitter parser for this language, creating one if none is free.
+        
+        Returns:
+            Tree-sitter Parser configured with this parser's language
+        """
+        with _parser_pool_lock:
+            idle = _parser_pool.get(type(self))
+            if idle:
+                return idle.pop()
+        
+        parser = ts.Parser()
+        try:
+            parser.set_language(self._language)
+        except AttributeError:
+            parser.language = self._language
+        return parser
+    
+    def _release_parser(self, parser: ts.Parser) -> None:
+        """Return a parser taken with _acquire_parser to the pool."""
+        with _parser_pool_lock:
+            _parser_pool.setdefault(type(self), []).append(parser)
+    
     def _get_tree_sitter_language_with_timeout(self) -> Optional[ts.Language]:
         """Get tree-sitter language with timeout protection."""
         result = [None]
@@ -183,11 +224,13 @@ class AdvancedParser(ABC):
                 result.add_warning("Empty source code provided")
                 return result
             
-            if len(source_code.encode('utf-8')) > self.max_file_size:
-                raise FallbackError(f"File too large: {len(source_code)} bytes > {self.max_file_size}")
+            # Encode once; the bytes are reused for parsing and node text extraction
+            source_bytes = self._encode_source(source_code)
+            if len(source_bytes) > self.max_file_size:
+                raise FallbackError(f"File too large: {len(source_bytes)} bytes > {self.max_file_size}")
             
             # Parse with tree-sitter with timeout protection
-            tree = self._parse_with_tree_sitter_with_timeout(source_code)
+            tree = self._parse_with_tree_sitter_with_timeout(source_bytes)
             if not tree:
                 raise FallbackError("Parsing timed out")
                 
@@ -227,12 +270,12 @@ class AdvancedParser(ABC):
         
         return result
     
-    def _parse_with_tree_sitter_with_timeout(self, source_code: str) -> Optional[ts.Tree]:
+    def _parse_with_tree_sitter_with_timeout(self, source_bytes: bytes) -> Optional[ts.Tree]:
         """
         Parse source code with tree-sitter with timeout protection.
         
         Args:
-            source_code: Source code to parse
+            source_bytes: UTF-8 encoded source code to parse
             
         Returns:
             Parsed tree-sitter tree or None if timeout
@@ -240,14 +283,13 @@ class AdvancedParser(ABC):
         if not self._parser:
             return None
         
+        parser = self._acquire_parser()
         result = [None]
         error = [None]
         
         def parse_code():
             try:
-                # Convert to bytes for tree-sitter
-                source_bytes = source_code.encode('utf-8')
-                result[0] = self._parser.parse(source_bytes)
+                result[0] = parser.parse(source_bytes)
             except Exception as e:
                 error[0] = e
         
@@ -259,12 +301,15 @@ class AdvancedParser(ABC):
         
         if thread.is_alive():
             logger.warning(f"Parsing timeout for {self.language_name} file")
+            # The abandoned thread still owns the parser, so it is not returned to the pool
             return None
         
+        self._release_parser(parser)
+        
         if error[0]:
             logger.error(f"Parsing error: {error[0]}")
             return None
-            
+        
         return result[0]
     
     def _extract_semantic_elements_safe(self, tree: ts.Tree, source_code: str) -> List[SemanticElement]:
@@ -308,7 +353,8 @@ class AdvancedParser(ABC):
             return
             
         source_lines = source_code.split('\n')
-        source_length = len(source_code)
+        source_bytes = self._encoded_source[1] if self._encoded_source[0] is source_code else None
+        source_length = len(source_bytes) if source_bytes is not None else len(source_code)
         
         for element in elements:
             try:
@@ -322,7 +368,9 @@ class AdvancedParser(ABC):
                 # Validate content consistency
                 if element.content:
                     try:
-                        extracted_content = source_code[element.position.start_byte:element.position.end_byte]
+                        extracted_content = self._slice_source(
+                            source_code, element.position.start_byte, element.position.end_byte
+                        )
                         if element.content.strip() != extracted_content.strip():
                             logger.debug(f"Element '{element.name}' content may not match position")
                     except IndexError:
@@ -371,11 +419,50 @@ class AdvancedParser(ABC):
             Text content of the node
         """
         try:
-            return source_code[node.start_byte:node.end_byte]
+            return self._slice_source(source_code, node.start_byte, node.end_byte)
         except IndexError:
             logger.warning(f"Node position out of bounds: {node.start_byte}-{node.end_byte}")
             return ""
     
+    def _encode_source(self, source_code: str) -> bytes:
+        """
+        Encode source code to UTF-8 and remember it for byte-offset slicing.
+        
+        Args:
+            source_code: Source code about to be parsed
+            
+        Returns:
+            UTF-8 encoded source code
+        """
+        source_bytes = source_code.encode('utf-8')
+        # Equal lengths mean pure ASCII, where str slicing by byte offset is exact
+        ascii_only = len(source_bytes) == len(source_code)
+        self._encoded_source = (source_code, None if ascii_only else source_bytes)
+        return source_bytes
+    
+    def _slice_source(self, source_code: str, start_byte: int, end_byte: int) -> str:
+        """
+        Slice source code by tree-sitter byte offsets.
+        
+        Args:
+            source_code: Original source code
+            start_byte: Start byte offset
+            end_byte: End byte offset
+            
+        Returns:
+            Text between the two byte offsets
+        """
+        encoded_text, source_bytes = self._encoded_source
+        if encoded_text is not source_code:
+            # Not the source being parsed; encode it locally and keep the parse's cache
+            source_bytes = source_code.encode('utf-8')
+            if len(source_bytes) == len(source_code):
+                source_bytes = None
+
+        if source_bytes is None:
+            return source_code[start_byte:end_byte]
+        return source_bytes[start_byte:end_byte].decode('utf-8', errors='replace')
+    
     def _find_child_by_type(self, node: ts.Node, node_type: str) -> Optional[ts.Node]:
         """
         Find first child node of specific type.
@@ -429,17 +516,11 @@ class AdvancedParser(ABC):
         
         try:
             # This is a base implementation that can be overridden by language-specific parsers
-            # Look for comment nodes immediately before this node
-            parent = node.parent
-            if not parent:
-                return None
-            
-            node_index = parent.children.index(node)
-            if node_index > 0:
-                prev_node = parent.children[node_index - 1]
-                if 'comment' in prev_node.type:
-                    comment_text = self._get_node_text(prev_node, source_code)
-                    return self._clean_comment_text(comment_text)
+            # Look for a comment node immediately before this node
+            prev_node = node.prev_sibling
+            if prev_node is not None and 'comment' in prev_node.type:
+                comment_text = self._get_node_text(prev_node, source_code)
+                return self._clean_comment_text(comment_text)
             
             return None
         except Exception as e:
@@ -466,11 +547,12 @@ class AdvancedParser(ABC):
             
             for line in lines:
                 line = line.strip()
-                # Remove common prefixes
-                for prefix in ['//', '///', '/*', '*/', '*', '#']:
-                    if line.startswith(prefix):
-                        line = line[len(prefix):].strip()
-                        break
+                # Remove common prefixes; one C-level check skips unmarked lines
+                if line.startswith(_COMMENT_PREFIXES):
+                    for prefix in _COMMENT_PREFIXES:
+                        if line.startswith(prefix):
+                            line = line[len(prefix):].strip()
+                            break
                 if line:  # Only add non-empty lines
                     cleaned_lines.append(line)
             
@@ -10,6 +10,12 @@ from ....utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fallback patterns for class, function and async function definitions
+_CLASS_RE = re.compile(r'^class\s+(\w+).*?:')
+_FUNC_RE = re.compile(r'^(\s*)def\s+(\w+)\s*\(.*?\):')
+_ASYNC_FUNC_RE = re.compile(r'^(\s*)async\s+def\s+(\w+)\s*\(.*?\):')
+_DEFINITION_PREFIXES = ('class', 'def', 'async')
+
 
 class CodeElement(NamedTuple):
     """Represents a semantic code element."""
@@ -243,18 +249,13 @@ class ASTParser:
         elements = []
         lines = code.split('\n')
         
-        # Pattern for class definitions
-        class_pattern = r'^class\s+(\w+).*?:'
-        
-        # Pattern for function definitions
-        func_pattern = r'^(\s*)def\s+(\w+)\s*\(.*?\):'
-        
-        # Pattern for async function definitions
-        async_func_pattern = r'^(\s*)async\s+def\s+(\w+)\s*\(.*?\):'
-        
         for i, line in enumerate(lines, 1):
+            # Only lines opening a definition can match any of the patterns
+            if not line.lstrip().startswith(_DEFINITION_PREFIXES):
+                continue
+            
             # Check for class
-            class_match = re.match(class_pattern, line.strip())
+            class_match = _CLASS_RE.match(line.strip())
             if class_match:
                 elements.append(CodeElement(
                     name=class_match.group(1),
@@ -265,7 +266,7 @@ class ASTParser:
                 ))
             
             # Check for function
-            func_match = re.match(func_pattern, line)
+            func_match = _FUNC_RE.match(line)
             if func_match:
                 indent = func_match.group(1)
                 func_name = func_match.group(2)
@@ -280,7 +281,7 @@ class ASTParser:
                 ))
             
             # Check for async function
-            async_match = re.match(async_func_pattern, line)
+            async_match = _ASYNC_FUNC_RE.match(line)
             if async_match:
                 indent = async_match.group(1)
                 func_name = async_match.group(2)
@@ -8,7 +8,6 @@ attributes, XML documentation, and more.
 
 from typing import Dict, List, Optional
 import tree_sitter as ts
-import tree_sitter_c_sharp as ts_csharp
 
 from .advanced_parser import AdvancedParser
 from .semantic_element import (
@@ -52,6 +51,8 @@ class CSharpAdvancedParser(AdvancedParser):
     
     def _get_tree_sitter_language(self) -> ts.Language:
         """Get C# tree-sitter language."""
+        # Imported on first use so processes that never chunk C# skip the grammar
+        import tree_sitter_c_sharp as ts_csharp
         return ts.Language(ts_csharp.language())
     
     def _extract_semantic_elements(self, tree: ts.Tree, source_code: str) -> List[SemanticElement]:
@@ -441,23 +442,17 @@ class CSharpAdvancedParser(AdvancedParser):
     
     def _extract_xml_documentation(self, node: ts.Node, source_code: str) -> Optional[str]:
         """Extract XML documentation comments."""
-        # Look for documentation comments before the node
-        parent = node.parent
-        if not parent:
-            return None
-        
+        # Look backwards through the preceding siblings for documentation comments
         try:
-            node_index = parent.children.index(node)
-            
-            # Look backwards for documentation comments
             docs = []
-            for i in range(node_index - 1, -1, -1):
-                prev_node = parent.children[i]
+            prev_node = node.prev_sibling
+            while prev_node is not None:
                 if prev_node.type == "comment" and "///" in self._get_node_text(prev_node, source_code):
                     doc_text = self._get_node_text(prev_node, source_code)
                     docs.insert(0, doc_text)
                 elif prev_node.type not in ["comment", "whitespace"]:
                     break
+                prev_node = prev_node.prev_sibling
             
             if docs:
                 # Clean up XML documentation
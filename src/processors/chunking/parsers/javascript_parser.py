@@ -8,7 +8,6 @@ async/await, destructuring, and JSX.
 
 from typing import Dict, List, Optional
 import tree_sitter as ts
-import tree_sitter_javascript as ts_javascript
 
 from .advanced_parser import AdvancedParser
 from .semantic_element import (
@@ -54,6 +53,8 @@ class JavaScriptAdvancedParser(AdvancedParser):
     
     def _get_tree_sitter_language(self) -> ts.Language:
         """Get JavaScript tree-sitter language."""
+        # Imported on first use so processes that never chunk JavaScript skip the grammar
+        import tree_sitter_javascript as ts_javascript
         return ts.Language(ts_javascript.language())
     
     def _extract_semantic_elements(self, tree: ts.Tree, source_code: str) -> List[SemanticElement]:
@@ -561,18 +562,11 @@ class JavaScriptAdvancedParser(AdvancedParser):
     
     def _extract_jsdoc_comment(self, node: ts.Node, source_code: str) -> Optional[str]:
         """Extract JSDoc comment for a node."""
-        # Look for comment nodes immediately before this node
-        parent = node.parent
-        if not parent:
-            return None
-        
+        # Look backwards through the preceding siblings for JSDoc comments
         try:
-            node_index = parent.children.index(node)
-            
-            # Look backwards for JSDoc comments
             docs = []
-            for i in range(node_index - 1, -1, -1):
-                prev_node = parent.children[i]
+            prev_node = node.prev_sibling
+            while prev_node is not None:
                 if prev_node.type == "comment":
                     comment_text = self._get_node_text(prev_node, source_code)
                     if comment_text.startswith("/**"):
@@ -580,8 +574,9 @@ class JavaScriptAdvancedParser(AdvancedParser):
                     elif comment_text.startswith("//"):
                         # Regular comment, stop looking
                         break
-                elif prev_node.type not in ["comment"]:
+                else:
                     break
+                prev_node = prev_node.prev_sibling
             
             if docs:
                 # Clean up JSDoc
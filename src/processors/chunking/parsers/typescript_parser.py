@@ -8,7 +8,6 @@ decorators, namespaces, and modern ES6+ features.
 
 from typing import Dict, List, Optional
 import tree_sitter as ts
-import tree_sitter_typescript as ts_typescript
 
 from .javascript_parser import JavaScriptAdvancedParser
 from .semantic_element import (
@@ -55,6 +54,8 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
     
     def _get_tree_sitter_language(self) -> ts.Language:
         """Get TypeScript tree-sitter language."""
+        # Imported on first use so processes that never chunk TypeScript skip the grammar
+        import tree_sitter_typescript as ts_typescript
         return ts.Language(ts_typescript.language_typescript())
     
     def _process_program(self, node: ts.Node, source_code: str) -> List[SemanticElement]:
@@ -131,7 +132,7 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
             language_specific={
                 "extends_types": extends_types,
                 "is_exported": self._is_in_export(node),
-                "is_declared": self._is_declared(node)
+                "is_declared": self._is_declared(node, source_code)
             }
         )
         
@@ -177,7 +178,7 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
             language_specific={
                 "type_definition": type_annotation,
                 "is_exported": self._is_in_export(node),
-                "is_declared": self._is_declared(node)
+                "is_declared": self._is_declared(node, source_code)
             }
         )
     
@@ -204,7 +205,7 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
             language_specific={
                 "is_const": is_const,
                 "is_exported": self._is_in_export(node),
-                "is_declared": self._is_declared(node)
+                "is_declared": self._is_declared(node, source_code)
             }
         )
         
@@ -237,7 +238,7 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
             tree_sitter_node_type=node.type,
             language_specific={
                 "is_exported": self._is_in_export(node),
-                "is_declared": self._is_declared(node)
+                "is_declared": self._is_declared(node, source_code)
             }
         )
         
@@ -333,7 +334,7 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
         # Update language-specific info
         function_element.language_specific.update({
             "has_decorators": len(decorators) > 0,
-            "is_declared": self._is_declared(node)
+            "is_declared": self._is_declared(node, source_code)
         })
         
         return function_element
@@ -499,22 +500,15 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
         """Extract TypeScript decorators."""
         decorators = []
         
-        # Look for decorator nodes before the main node
-        parent = node.parent
-        if parent:
-            try:
-                node_index = parent.children.index(node)
-                
-                # Look backwards for decorators
-                for i in range(node_index - 1, -1, -1):
-                    prev_node = parent.children[i]
-                    if prev_node.type == "decorator":
-                        decorator_text = self._get_node_text(prev_node, source_code)
-                        decorators.insert(0, decorator_text)
-                    elif prev_node.type not in ["comment"]:
-                        break
-            except (ValueError, IndexError):
-                pass
+        # Look backwards through the preceding siblings for decorators
+        prev_node = node.prev_sibling
+        while prev_node is not None:
+            if prev_node.type == "decorator":
+                decorator_text = self._get_node_text(prev_node, source_code)
+                decorators.insert(0, decorator_text)
+            elif prev_node.type not in ["comment"]:
+                break
+            prev_node = prev_node.prev_sibling
         
         return decorators
     
@@ -650,21 +644,17 @@ class TypeScriptAdvancedParser(JavaScriptAdvancedParser):
         
         return ' '.join(signature_parts)
     
-    def _is_declared(self, node: ts.Node) -> bool:
+    def _is_declared(self, node: ts.Node, source_code: str) -> bool:
         """Check if node is in a declare context."""
-        # Look for 'declare' keyword in ancestors
-        parent = node.parent
-        while parent:
-            node_text = self._get_node_text(parent, "")
-            if node_text.startswith("declare "):
-                return True
         # Look for 'declare' keyword in ancestors, with a maximum depth limit
         parent = node.parent
         max_depth = 1000
         depth = 0
-        while parent and depth < max_depth:
-            node_text = self._get_node_text(parent, "")
-            if node_text.startswith("declare "):
+        # The program root is skipped: a file that opens with 'declare' does not make every node ambient
+        while parent and parent.parent and depth < max_depth:
+            # Only the leading keyword matters, so avoid slicing the whole ancestor
+            node_text = self._slice_source(source_code, parent.start_byte, parent.start_byte + len("declare "))
+            if node_text == "declare ":
                 return True
             parent = parent.parent
             depth += 1
@@ -36,6 +36,22 @@ class TypeScriptChunker(JavaScriptChunker):
     Falls back to JavaScript parsing or text-based chunking if TypeScript parsing fails.
     """
     
+    # TypeScript chunk type for the primary semantic element of a chunk
+    CHUNK_TYPE_MAP = {
+        ElementType.IMPORT: "import",
+        ElementType.EXPORT: "export",
+        ElementType.TYPE_ALIAS: "type",
+        ElementType.INTERFACE: "interface",
+        ElementType.ENUM: "enum",
+        ElementType.NAMESPACE: "namespace",
+        ElementType.CLASS: "class",
+        ElementType.FUNCTION: "function",
+        ElementType.METHOD: "method",
+        ElementType.VARIABLE: "variable",
+        ElementType.CONSTANT: "constant",
+        ElementType.COMMENT: "comment"
+    }
+    
     def __init__(self, max_chunk_size: int = 1800, chunk_overlap: int = 75, use_advanced_parsing: Optional[bool] = None):
         """
         Initialize TypeScript chunker.
@@ -264,23 +280,8 @@ class TypeScriptChunker(JavaScriptChunker):
             # Use the first element to determine chunk characteristics
             primary_element = elements[0]
             
-            # TypeScript-specific chunk type mapping
-            chunk_type_map = {
-                ElementType.IMPORT: "import",
-                ElementType.EXPORT: "export",
-                ElementType.TYPE_ALIAS: "type",
-                ElementType.INTERFACE: "interface",
-                ElementType.ENUM: "enum",
-                ElementType.NAMESPACE: "namespace",
-                ElementType.CLASS: "class",
-                ElementType.FUNCTION: "function",
-                ElementType.METHOD: "method",
-                ElementType.VARIABLE: "variable",
-                ElementType.CONSTANT: "constant",
-                ElementType.COMMENT: "comment"
-            }
-            
-            chunk_type = chunk_type_map.get(primary_element.element_type, "content")
+            # Determine chunk type based on primary element
+            chunk_type = self.CHUNK_TYPE_MAP.get(primary_element.element_type, "content")
             
             # Collect all symbol names
             symbol_names = [e.name for e in elements if e.name and e.name != "comment"]
@@ -1,6 +1,9 @@
+import re
+from collections import Counter
+
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.docstore.document import Document
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from ..config import settings
 from ..utils.logging import get_logger
@@ -9,6 +12,9 @@ from ..config.chunking_config import ChunkingConfigManager
 
 logger = get_logger(__name__)
 
+# Four or more consecutive newlines, collapsed to three when cleaning text
+_EXCESS_NEWLINES_RE = re.compile(r'\n{4,}')
+
 class TextProcessor:
     """Text processing and chunking with enhanced semantic support"""
     
@@ -147,6 +153,25 @@ class TextProcessor:
         else:
             return self._process_documents_traditional(documents)
     
+    def iter_process_documents(self, documents: List[Document], batch_size: int = 50) -> Iterator[List[Document]]:
+        """
+        Process documents in batches, yielding the chunks of each batch.
+        
+        Lets callers store or embed chunks as they are produced, so peak memory
+        grows with one batch instead of the whole repository.
+        
+        Args:
+            documents: Documents to process
+            batch_size: Number of source documents chunked per batch
+            
+        Yields:
+            Chunked documents for each batch of source documents
+        """
+        for start in range(0, len(documents), batch_size):
+            chunks = self.process_documents(documents[start:start + batch_size])
+            if chunks:
+                yield chunks
+    
     def _process_documents_enhanced(self, documents: List[Document]) -> List[Document]:
         """Process documents using enhanced semantic chunking."""
         try:
@@ -163,11 +188,17 @@ class TextProcessor:
             
             for doc in documents:
                 try:
+                    # Skip blank documents before cleaning or chunker dispatch
+                    if not doc.page_content or doc.page_content.isspace():
+                        skipped_empty += 1
+                        logger.debug(f"Skipping empty document: {doc.metadata.get('file_path', 'unknown')}")
+                        continue
+                    
                     # Clean text
                     cleaned_text = self._clean_text(doc.page_content)
                     
-                    # Skip empty documents but log them
-                    if not cleaned_text.strip():
+                    # Skip documents left empty by cleaning (_clean_text strips its result)
+                    if not cleaned_text:
                         skipped_empty += 1
                         logger.debug(f"Skipping empty document: {doc.metadata.get('file_path', 'unknown')}")
                         continue
@@ -253,25 +284,30 @@ class TextProcessor:
         
         for doc in documents:
             try:
+                # Skip blank documents before cleaning or splitting
+                if not doc.page_content or doc.page_content.isspace():
+                    continue
+                
                 # Clean text
                 cleaned_text = self._clean_text(doc.page_content)
                 doc.page_content = cleaned_text
                 
-                # Skip empty documents
-                if not cleaned_text.strip():
+                # Skip empty documents (_clean_text strips its result)
+                if not cleaned_text:
                     continue
                 
                 # Split into chunks
                 chunks = self.text_splitter.split_documents([doc])
                 
                 # Add chunk metadata
+                total_chunks = len(chunks)
                 for i, chunk in enumerate(chunks):
-                    chunk.metadata.update({
-                        "chunk_index": i,
-                        "total_chunks": len(chunks),
-                        "chunk_size": len(chunk.page_content),
-                        "chunking_method": "traditional"
-                    })
+                    chunk.metadata.update(
+                        chunk_index=i,
+                        total_chunks=total_chunks,
+                        chunk_size=len(chunk.page_content),
+                        chunking_method="traditional"
+                    )
                 
                 processed_docs.extend(chunks)
                 
@@ -292,21 +328,11 @@ class TextProcessor:
         text = text.replace('\r\n', '\n')
         text = text.replace('\r', '\n')
         
-        # Remove excessive whitespace while preserving structure
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove trailing whitespace but keep leading whitespace for code structure
-            cleaned_line = line.rstrip()
-            cleaned_lines.append(cleaned_line)
-        
-        # Join lines and remove excessive blank lines
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Remove trailing whitespace but keep leading whitespace for code structure
+        cleaned_text = '\n'.join([line.rstrip() for line in text.split('\n')])
         
         # Remove more than 3 consecutive newlines
-        import re
-        cleaned_text = re.sub(r'\n{4,}', '\n\n\n', cleaned_text)
+        cleaned_text = _EXCESS_NEWLINES_RE.sub('\n\n\n', cleaned_text)
         
         return cleaned_text.strip()
     
@@ -315,16 +341,18 @@ class TextProcessor:
         if not documents:
             return {"total_chunks": 0, "avg_chunk_size": 0, "total_chars": 0}
         
-        total_chars = sum(len(doc.page_content) for doc in documents)
-        avg_chunk_size = total_chars / len(documents) if documents else 0
+        # Measure each chunk once and reuse the sizes for sum, min and max
+        sizes = [len(doc.page_content) for doc in documents]
+        total_chars = sum(sizes)
+        avg_chunk_size = total_chars / len(documents)
         
         # Enhanced statistics if using semantic chunking
         stats = {
             "total_chunks": len(documents),
             "avg_chunk_size": round(avg_chunk_size, 2),
             "total_chars": total_chars,
-            "min_chunk_size": min(len(doc.page_content) for doc in documents),
-            "max_chunk_size": max(len(doc.page_content) for doc in documents),
+            "min_chunk_size": min(sizes),
+            "max_chunk_size": max(sizes),
             "enhanced_chunking": self.use_enhanced_chunking
         }
         
@@ -336,34 +364,30 @@ class TextProcessor:
     
     def _get_semantic_stats(self, documents: List[Document]) -> dict:
         """Get statistics specific to semantic chunking."""
-        semantic_stats = {
-            "chunk_types": {},
-            "languages": {},
-            "has_documentation": 0,
-            "symbol_count": 0
-        }
+        chunk_types = Counter()
+        languages = Counter()
+        has_documentation = 0
+        symbol_count = 0
         
         for doc in documents:
             metadata = doc.metadata
             
-            # Count chunk types
-            chunk_type = metadata.get("chunk_type", "unknown")
-            semantic_stats["chunk_types"][chunk_type] = semantic_stats["chunk_types"].get(chunk_type, 0) + 1
+            chunk_types[metadata.get("chunk_type", "unknown")] += 1
+            languages[metadata.get("language", "unknown")] += 1
             
-            # Count languages
-            language = metadata.get("language", "unknown")
-            semantic_stats["languages"][language] = semantic_stats["languages"].get(language, 0) + 1
-            
-            # Count documentation
             if metadata.get("contains_documentation", False):
-                semantic_stats["has_documentation"] += 1
+                has_documentation += 1
             
-            # Count symbols
             symbols = metadata.get("symbols", [])
             if isinstance(symbols, list):
-                semantic_stats["symbol_count"] += len(symbols)
+                symbol_count += len(symbols)
         
-        return semantic_stats
+        return {
+            "chunk_types": dict(chunk_types),
+            "languages": dict(languages),
+            "has_documentation": has_documentation,
+            "symbol_count": symbol_count
+        }
     
     def get_chunking_info(self) -> dict:
         """Get information about the current chunking configuration."""
@@ -3,6 +3,7 @@ from langchain_community.vectorstores.utils import filter_complex_metadata
 from langchain.schema import Document
 from typing import List, Dict, Any, Optional
 import chromadb
+import json
 import os
 import shutil
 import time
@@ -14,6 +15,45 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+def _identity(value):
+    return value
+
+
+def _to_json_metadata(value) -> str:
+    """Serialize nested values as JSON so they can be parsed back after retrieval"""
+    return json.dumps(value, default=str)
+
+
+def _list_to_metadata(value: list) -> str:
+    """Convert lists to strings for ChromaDB compatibility"""
+    if all(isinstance(item, str) for item in value):
+        return ", ".join(value)
+    return _to_json_metadata(value)
+
+
+def _other_to_metadata(value):
+    """Keep subclasses of primitive types (e.g. str enums), stringify everything else"""
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return _list_to_metadata(value)
+    if isinstance(value, dict):
+        return _to_json_metadata(value)
+    return str(value)
+
+
+# Metadata converters keyed on exact value type so the common case is one dict lookup
+_METADATA_CONVERTERS = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    list: _list_to_metadata,
+    dict: _to_json_metadata,
+}
+
 class ChromaStore(BaseVectorStore):
     """Simplified Chroma vector store implementation with robust error handling"""
     
@@ -22,12 +62,16 @@ class ChromaStore(BaseVectorStore):
                  host: str = "localhost",
                  port: int = 8000,
                  embedding_function = None,
-                 persist_directory: str = "./chroma_db"):
+                 persist_directory: str = "./chroma_db",
+                 client = None):
         self.collection_name = collection_name
         self.host = host
         self.port = port
         self.persist_directory = persist_directory
         
+        # Optional pre-built Chroma client shared between stores to reuse its connection
+        self.client = client
+        
         # Set up default embedding function (for backward compatibility)
         self.default_embedding_function = embedding_function or get_embedding_function()
         
@@ -45,7 +89,11 @@ class ChromaStore(BaseVectorStore):
         try:
             # Check if we should use remote or local ChromaDB
             logger.info(f"Host comparison: '{self.host}' != 'localhost' = {self.host != 'localhost'}, '{self.host}' != '127.0.0.1' = {self.host != '127.0.0.1'}")
-            if self.host != "localhost" and self.host != "127.0.0.1":
+            if self.client is not None:
+                # Injected client; host and port were not used to create it
+                logger.info("Initializing Chroma with injected client")
+                self._initialize_remote_chroma()
+            elif self.host != "localhost" and self.host != "127.0.0.1":
                 # Remote ChromaDB connection
                 logger.info(f"Initializing Chroma with remote client: {self.host}:{self.port}")
                 self._initialize_remote_chroma()
@@ -77,11 +125,16 @@ class ChromaStore(BaseVectorStore):
     def _initialize_remote_chroma(self):
         """Initialize Chroma with remote ChromaDB connection"""
         try:
-            # Create HTTP client for remote ChromaDB
-            client = chromadb.HttpClient(
-                host=self.host,
-                port=self.port
-            )
+            # Reuse an injected client, otherwise create HTTP client for remote ChromaDB
+            if self.client is None:
+                self.client = chromadb.HttpClient(
+                    host=self.host,
+                    port=self.port
+                )
+                client_description = f"remote client: {self.host}:{self.port}"
+            else:
+                client_description = "injected client"
+            client = self.client
             
             # Check if collection exists, create if it doesn't
             try:
@@ -102,7 +155,7 @@ class ChromaStore(BaseVectorStore):
                 embedding_function=self.embedding_function
             )
             
-            logger.info(f"ChromaStore initialized successfully with remote client: {self.host}:{self.port}")
+            logger.info(f"ChromaStore initialized successfully with {client_description}")
             
         except Exception as e:
             logger.error(f"Failed to initialize remote Chroma: {str(e)}")
@@ -281,20 +334,8 @@ class ChromaStore(BaseVectorStore):
             # Fallback: manually filter known complex types
             filtered_metadata = {}
             for key, value in doc.metadata.items():
-                if isinstance(value, (str, int, float, bool)) or value is None:
-                    filtered_metadata[key] = value
-                elif isinstance(value, list):
-                    # Convert lists to strings for ChromaDB compatibility
-                    if all(isinstance(item, str) for item in value):
-                        filtered_metadata[key] = ", ".join(value)
-                    else:
-                        filtered_metadata[key] = str(value)
-                elif isinstance(value, dict):
-                    # Convert dicts to strings
-                    filtered_metadata[key] = str(value)
-                else:
-                    # Convert other complex types to strings
-                    filtered_metadata[key] = str(value)
+                converter = _METADATA_CONVERTERS.get(type(value), _other_to_metadata)
+                filtered_metadata[key] = converter(value)
             
             filtered_doc = Document(
                 page_content=doc.page_content,
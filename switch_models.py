@@ -13,9 +13,6 @@ sys.path.append(str(Path(__file__).parent))
 from typing import Dict, Any
 from src.config.settings import settings
 from src.config.model_config import ModelConfiguration
-from src.llm.embedding_factory import EmbeddingFactory
-from src.vectorstores.chroma_store import ChromaStore
-from src.utils.model_migration import migration_manager
 from src.utils.logging import setup_logging, get_logger
 
 # Setup logging
@@ -38,6 +35,9 @@ def print_current_config():
 
 def validate_model_switch(new_embedding_model: str) -> Dict[str, Any]:
     """Validate model switch before proceeding"""
+    # Imported lazily: the migration manager pulls in Chroma and the embedding stack
+    from src.utils.model_migration import migration_manager
+    
     print(f"\n🔍 Validating switch to {new_embedding_model}...")
     
     validation_result = migration_manager.validate_model_switch(new_embedding_model)
@@ -74,7 +74,9 @@ def switch_embedding_model(new_model: str, force: bool = False) -> bool:
             settings.embedding_model = new_model
             return True
         
-        # Initialize vector store
+        # Initialize vector store (imported lazily so other commands skip Chroma)
+        from src.utils.model_migration import migration_manager
+        from src.vectorstores.chroma_store import ChromaStore
         print(f"\n🔄 Initializing vector store for migration...")
         vector_store = ChromaStore(
             collection_name=settings.chroma_collection_name,
@@ -178,6 +180,7 @@ def show_migration_history():
     """Show migration history"""
     print("\n📜 Migration History:")
     
+    from src.utils.model_migration import migration_manager
     history = migration_manager.get_migration_history()
     if not history:
         print("   No migrations found.")
@@ -0,0 +1,84 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MAIN_PY = REPO_ROOT / "main.py"
+ROUTES_PY = REPO_ROOT / "src" / "api" / "routes.py"
+
+# Make the project root importable once for every test module
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+@pytest.fixture(scope="session")
+def main_py_path():
+    """Absolute path of main.py"""
+    return MAIN_PY
+
+
+@pytest.fixture(scope="session")
+def routes_py_path():
+    """Absolute path of src/api/routes.py"""
+    return ROUTES_PY
+
+
+@pytest.fixture(scope="session")
+def main_py_source(main_py_path):
+    """Source text of main.py, read once per test session"""
+    return main_py_path.read_text()
+
+
+@pytest.fixture(scope="session")
+def routes_py_source(routes_py_path):
+    """Source text of src/api/routes.py, read once per test session"""
+    return routes_py_path.read_text()
+
+
+def _collect_symbols(tree):
+    """Index every function definition and the top-level imports of a parsed module"""
+    funcs = set()
+    async_funcs = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AsyncFunctionDef):
+            async_funcs.add(node.name)
+            funcs.add(node.name)
+        elif isinstance(node, ast.FunctionDef):
+            funcs.add(node.name)
+    
+    # "import x" records the module x, "from x import y" records the imported name y
+    imports = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.update(alias.name for alias in node.names)
+    return {"funcs": funcs, "async_funcs": async_funcs, "imports": imports}
+
+
+@pytest.fixture(scope="session")
+def main_ast(main_py_source):
+    """main.py parsed once per test session"""
+    return ast.parse(main_py_source)
+
+
+@pytest.fixture(scope="session")
+def main_symbols(main_ast):
+    """Function and import names defined in main.py"""
+    return _collect_symbols(main_ast)
+
+
+@pytest.fixture(scope="session")
+def routes_ast(routes_py_source):
+    """src/api/routes.py parsed once per test session"""
+    return ast.parse(routes_py_source)
+
+
+@pytest.fixture(scope="session")
+def routes_symbols(routes_ast):
+    """Function and import names defined in src/api/routes.py"""
+    return _collect_symbols(routes_ast)
@@ -1,50 +1,48 @@
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock
 from src.agents.agent_router import AgentRouter
 from src.config.agent_config import AgentConfig, AgentRoutingConfig
-from src.agents.response_models import AgentResponse
+
+
+@pytest.fixture(scope="module")
+def base_config():
+    """Shared configuration; AgentRouter only ever stores copies of it"""
+    return AgentConfig(routing=AgentRoutingConfig())
+
+
+@pytest.fixture
+def mock_agents():
+    """Fresh RAG and diagram agent mocks"""
+    return Mock(), Mock()
+
 
 class TestAgentRouterConfiguration:
     """Test configuration handling and copying in AgentRouter"""
     
-    def test_configuration_copying_on_initialization(self):
+    def test_configuration_copying_on_initialization(self, base_config, mock_agents):
         """Test that AgentRouter creates a copy of configuration and handles it properly"""
-        # Create a mock RAG agent and diagram agent
-        mock_rag_agent = Mock()
-        mock_diagram_agent = Mock()
-        
-        # Create an original configuration
-        original_config = AgentConfig(
-            routing=AgentRoutingConfig()
-        )
+        mock_rag_agent, mock_diagram_agent = mock_agents
         
         # Initialize router with diagram_agent
         router = AgentRouter(
             rag_agent=mock_rag_agent,
             diagram_agent=mock_diagram_agent,
-            config=original_config
+            config=base_config
         )
         
         # Verify that the router's configuration is a copy
-        assert router.agent_config is not original_config
-        if hasattr(router.agent_config, 'routing') and hasattr(original_config, 'routing'):
-            assert router.agent_config.routing is not original_config.routing
+        assert router.agent_config is not base_config
+        if hasattr(router.agent_config, 'routing') and hasattr(base_config, 'routing'):
+            assert router.agent_config.routing is not base_config.routing
     
-    def test_configuration_update_method(self):
+    def test_configuration_update_method(self, base_config, mock_agents):
         """Test that update_configuration creates a copy and works properly"""
-        # Create a mock RAG agent and diagram agent
-        mock_rag_agent = Mock()
-        mock_diagram_agent = Mock()
-        
-        # Create router with initial configuration
-        initial_config = AgentConfig(
-            routing=AgentRoutingConfig()
-        )
+        mock_rag_agent, mock_diagram_agent = mock_agents
         
         router = AgentRouter(
             rag_agent=mock_rag_agent,
             diagram_agent=mock_diagram_agent,
-            config=initial_config
+            config=base_config
         )
         
         # Create a new configuration to update with
@@ -60,11 +58,9 @@ class TestAgentRouterConfiguration:
         if hasattr(router.agent_config, 'routing') and hasattr(new_config, 'routing'):
             assert router.agent_config.routing is not new_config.routing
     
-    def test_get_current_configuration_returns_copy(self):
+    def test_get_current_configuration_returns_copy(self, mock_agents):
         """Test that get_current_configuration returns a copy to prevent external modification"""
-        # Create a mock RAG agent and diagram agent
-        mock_rag_agent = Mock()
-        mock_diagram_agent = Mock()
+        mock_rag_agent, mock_diagram_agent = mock_agents
         
         # Create router
         router = AgentRouter(
@@ -80,9 +76,9 @@ class TestAgentRouterConfiguration:
         if hasattr(current_config, 'routing') and hasattr(router.agent_config, 'routing'):
             assert current_config.routing is not router.agent_config.routing
     
-    def test_router_with_no_diagram_agent(self):
+    def test_router_with_no_diagram_agent(self, mock_agents):
         """Test router behavior when no diagram agent is provided"""
-        mock_rag_agent = Mock()
+        mock_rag_agent, _ = mock_agents
         
         # Create router without diagram agent
         router = AgentRouter(
@@ -97,3 +93,31 @@ class TestAgentRouterConfiguration:
         # Should have route cache
         assert hasattr(router, '_route_cache')
         assert isinstance(router._route_cache, dict)
+    
+    def test_route_cache_is_bounded_lru(self, mock_agents):
+        """Test that route decisions are cached on the normalized question and evicted LRU-first"""
+        mock_rag_agent, _ = mock_agents
+        router = AgentRouter(rag_agent=mock_rag_agent, diagram_agent=None)
+        router.ROUTE_CACHE_SIZE = 2
+        
+        assert router._get_route("Show me a sequence diagram") == AgentRouter.ROUTE_DIAGRAM
+        assert router._get_route("  show me a SEQUENCE diagram ") == AgentRouter.ROUTE_DIAGRAM
+        assert len(router._route_cache) == 1
+        
+        router._get_route("How does authentication work?")
+        router._get_route("list repositories")
+        
+        assert len(router._route_cache) == 2
+        assert "show me a sequence diagram" not in router._route_cache
+        assert router._route_cache["list repositories"] == AgentRouter.ROUTE_REPOSITORY_INFO
+    
+    def test_route_cache_classifies_normalized_question(self, mock_agents):
+        """Test that DiagramAgent sees the normalized question the route is cached under"""
+        mock_rag_agent, mock_diagram_agent = mock_agents
+        mock_diagram_agent.can_handle_request.return_value = False
+        router = AgentRouter(rag_agent=mock_rag_agent, diagram_agent=mock_diagram_agent)
+        
+        router._get_route("  How do the Services TALK? ")
+        router._get_route("how do the services talk?")
+        
+        mock_diagram_agent.can_handle_request.assert_called_once_with("how do the services talk?")
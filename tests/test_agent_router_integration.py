@@ -2,268 +2,177 @@
 Test Agent Router Integration - TASK031
 
 This test suite validates the integration of DiagramAgent with AgentRouter,
-including dual-agent support, intelligent routing, and backward compatibility.
+including query routing, response adaptation and graceful degradation.
 """
 
-import unittest
-from unittest.mock import Mock, MagicMock, patch
+import pytest
+from types import MappingProxyType
+from unittest.mock import Mock
 from src.agents.agent_router import AgentRouter
-from src.config.agent_config import AgentConfig, DiagramAgentType, AGENT_CONFIG_PRESETS
-
-
-class TestAgentRouterIntegration(unittest.TestCase):
-    """Test agent router integration with dual diagram agent support"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        # Mock dependencies
-        self.mock_rag_agent = Mock()
-        self.mock_diagram_handler = Mock()
-        self.mock_diagram_agent = Mock()
-        
-        # Mock diagram handler methods
-        self.mock_diagram_handler.generate_sequence_diagram.return_value = {
-            "analysis_summary": "Handler generated diagram",
-            "mermaid_code": "sequenceDiagram\n    A->>B: test",
-            "diagram_type": "sequence",
-            "source_documents": [],
-            "status": "success"
-        }
-        
-        # Mock diagram agent methods
-        self.mock_diagram_agent.process_query.return_value = {
-            "answer": "Agent generated diagram",
-            "mermaid_code": "flowchart TD\n    A --> B",
-            "diagram_type": "flowchart",
-            "source_documents": [],
-            "status": "success"
-        }
-    
-    def test_backward_compatibility_initialization(self):
-        """Test that old initialization pattern still works"""
-        # Should work with just rag_agent and diagram_handler
-        router = AgentRouter(self.mock_rag_agent, self.mock_diagram_handler)
-        
-        # Should initialize with default config
-        self.assertIsNotNone(router.agent_config)
-        self.assertEqual(router.rag_agent, self.mock_rag_agent)
-        self.assertEqual(router.diagram_handler, self.mock_diagram_handler)
-        self.assertIsNone(router.diagram_agent)
-    
-    def test_enhanced_initialization(self):
-        """Test initialization with DiagramAgent"""
-        config = AGENT_CONFIG_PRESETS["modern"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent, 
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        self.assertEqual(router.diagram_agent, self.mock_diagram_agent)
-        self.assertEqual(router.agent_config, config)
-    
-    def test_agent_selection_diagram_handler_preference(self):
-        """Test agent selection with DiagramHandler preference"""
-        config = AGENT_CONFIG_PRESETS["legacy"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Should select DiagramHandler
-        selected = router._select_diagram_agent("create a sequence diagram")
-        self.assertEqual(selected, self.mock_diagram_handler)
-    
-    def test_agent_selection_diagram_agent_preference(self):
-        """Test agent selection with DiagramAgent preference"""
-        config = AGENT_CONFIG_PRESETS["modern"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Should select DiagramAgent
-        selected = router._select_diagram_agent("create a flowchart diagram")
-        self.assertEqual(selected, self.mock_diagram_agent)
-    
-    def test_auto_selection_simple_query(self):
-        """Test auto-selection for simple queries"""
-        config = AGENT_CONFIG_PRESETS["hybrid"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Simple sequence diagram request should use DiagramHandler
-        selected = router._select_diagram_agent("show me a sequence diagram")
-        self.assertEqual(selected, self.mock_diagram_handler)
-    
-    def test_auto_selection_complex_query(self):
-        """Test auto-selection for complex queries"""
-        config = AGENT_CONFIG_PRESETS["hybrid"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Complex request should use DiagramAgent
-        complex_query = "create a flowchart and class diagram showing the system architecture"
-        selected = router._select_diagram_agent(complex_query)
-        self.assertEqual(selected, self.mock_diagram_agent)
-    
-    def test_complex_query_detection(self):
-        """Test complex query detection logic"""
-        config = AGENT_CONFIG_PRESETS["hybrid"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Simple queries
-        self.assertFalse(router._is_complex_diagram_request("show me a sequence diagram"))
-        self.assertFalse(router._is_complex_diagram_request("create interaction diagram"))
-        
-        # Complex queries
-        self.assertTrue(router._is_complex_diagram_request("create flowchart and class diagram"))
-        self.assertTrue(router._is_complex_diagram_request("analyze the system architecture"))
-        self.assertTrue(router._is_complex_diagram_request("show component relationships"))
-    
-    def test_diagram_generation_with_handler(self):
-        """Test diagram generation using DiagramHandler"""
-        config = AGENT_CONFIG_PRESETS["legacy"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Mock the diagram request detection
-        router._is_diagram_request = Mock(return_value=True)
-        router._is_mermaid_specific_request = Mock(return_value=False)
-        
-        result = router._generate_diagram_response("create sequence diagram")
-        
-        # Should call DiagramHandler
-        self.mock_diagram_handler.generate_sequence_diagram.assert_called_once_with("create sequence diagram")
-        self.assertEqual(result["answer"], "Handler generated diagram")
-    
-    def test_diagram_generation_with_agent(self):
-        """Test diagram generation using DiagramAgent"""
-        config = AGENT_CONFIG_PRESETS["modern"]
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Mock the diagram request detection
-        router._is_diagram_request = Mock(return_value=True)
-        router._is_mermaid_specific_request = Mock(return_value=False)
-        
-        # Use a query that should definitely select DiagramAgent (modern config prefers it)
-        result = router._generate_diagram_response("create flowchart showing system architecture")
-        
-        # Should call DiagramAgent
-        self.mock_diagram_agent.process_query.assert_called_once_with("create flowchart showing system architecture")
-        self.assertEqual(result["answer"], "Agent generated diagram")
-    
-    def test_fallback_mechanism(self):
-        """Test fallback when primary agent fails"""
-        config = AGENT_CONFIG_PRESETS["hybrid"]
-        config.routing.enable_agent_fallback = True
-        
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            self.mock_diagram_agent,
-            config
-        )
-        
-        # Make DiagramAgent fail
-        self.mock_diagram_agent.process_query.side_effect = Exception("Agent failed")
-        
-        # Mock diagram request detection
-        router._is_diagram_request = Mock(return_value=True)
-        router._is_mermaid_specific_request = Mock(return_value=False)
-        
-        # This should be a complex query that would normally route to DiagramAgent
-        result = router._generate_diagram_response("create complex flowchart showing system architecture")
-        
-        # Should attempt DiagramAgent first, then fallback to DiagramHandler
-        self.mock_diagram_agent.process_query.assert_called()
-        self.mock_diagram_handler.generate_sequence_diagram.assert_called()
-        
-        # Result should indicate fallback was used
-        self.assertIn("Fallback Response", result["answer"])
-        self.assertTrue(result.get("fallback_used", False))
-    
-    def test_no_diagram_agent_graceful_degradation(self):
-        """Test graceful degradation when DiagramAgent is not available"""
-        config = AGENT_CONFIG_PRESETS["modern"]
-        
-        # Initialize without DiagramAgent
-        router = AgentRouter(
-            self.mock_rag_agent,
-            self.mock_diagram_handler,
-            diagram_agent=None,  # No DiagramAgent available
-            agent_config=config
-        )
-        
-        # Should always select DiagramHandler
-        selected = router._select_diagram_agent("create complex flowchart")
-        self.assertEqual(selected, self.mock_diagram_handler)
-    
-    def test_unified_agent_interface(self):
-        """Test unified interface for different agent types"""
-        router = AgentRouter(self.mock_rag_agent, self.mock_diagram_handler)
-        
-        # Test DiagramHandler interface
-        result_handler = router._generate_with_agent(self.mock_diagram_handler, "test query")
-        self.mock_diagram_handler.generate_sequence_diagram.assert_called_with("test query")
-        
-        # Test DiagramAgent interface
-        result_agent = router._generate_with_agent(self.mock_diagram_agent, "test query")
-        self.mock_diagram_agent.process_query.assert_called_with("test query")
-    
-    def test_configuration_validation(self):
-        """Test configuration validation and warnings"""
-        # Test invalid configuration (DiagramAgent preferred but not provided)
-        config = AGENT_CONFIG_PRESETS["modern"].copy(deep=True)
-        
-        with patch('src.agents.agent_router.logger') as mock_logger:
-            router = AgentRouter(
-                self.mock_rag_agent,
-                self.mock_diagram_handler,
-                diagram_agent=None,
-                agent_config=config
-            )
-            
-            # Should log warning and fallback to DiagramHandler
-            mock_logger.warning.assert_called()
-            self.assertEqual(router.agent_config.routing.preferred_diagram_agent, 
-                           DiagramAgentType.DIAGRAM_HANDLER)
+from src.agents.response_models import ResponseStatus, ResponseType
+from src.config.agent_config import DiagramAgentType, get_agent_config
+
+
+# Canned results are read-only so a router mutating them fails loudly
+_RAG_RESULT = MappingProxyType({
+    "answer": "RAG answer",
+    "source_documents": (),
+    "status": "success"
+})
+
+_AGENT_RESULT = MappingProxyType({
+    "answer": "Agent generated diagram",
+    "mermaid_code": "flowchart TD\n    A --> B",
+    "diagram_type": "flowchart",
+    "source_documents": (),
+    "status": "success"
+})
+
+
+class _StubRAGAgent:
+    """Interface of the RAG agent used to spec its mock"""
+
+    def process_query(self, query):
+        pass
+
+
+class _StubDiagramAgent:
+    """Interface of DiagramAgent used to spec its mock"""
+
+    def can_handle_request(self, query):
+        pass
+
+    def process_query(self, query):
+        pass
+
+
+@pytest.fixture(scope="module")
+def rag_agent_template():
+    """RAG agent mock shared by the module; reset after every test"""
+    rag_agent = Mock(spec=_StubRAGAgent)
+    rag_agent.process_query.return_value = _RAG_RESULT
+    return rag_agent
+
+
+@pytest.fixture(scope="module")
+def diagram_agent_template():
+    """DiagramAgent mock shared by the module; reset after every test"""
+    diagram_agent = Mock(spec=_StubDiagramAgent)
+    diagram_agent.process_query.return_value = _AGENT_RESULT
+    return diagram_agent
+
+
+@pytest.fixture
+def mock_rag_agent(rag_agent_template):
+    yield rag_agent_template
+    # Keep the canned return values, drop recorded calls and side effects
+    rag_agent_template.reset_mock(side_effect=True)
+
+
+@pytest.fixture
+def mock_diagram_agent(diagram_agent_template):
+    diagram_agent_template.can_handle_request.return_value = False
+    yield diagram_agent_template
+    diagram_agent_template.reset_mock(side_effect=True)
+
+
+@pytest.fixture
+def router(mock_rag_agent, mock_diagram_agent):
+    """Router with the default config; its route cache is per test"""
+    return AgentRouter(mock_rag_agent, mock_diagram_agent)
+
+
+# (query, expected route)
+ROUTE_CASES = [
+    ("create a sequence diagram", AgentRouter.ROUTE_DIAGRAM),
+    ("create a flowchart and class diagram showing the system architecture", AgentRouter.ROUTE_DIAGRAM),
+    ("visualize the service interaction", AgentRouter.ROUTE_DIAGRAM),
+    ("list repositories", AgentRouter.ROUTE_REPOSITORY_INFO),
+    ("How does authentication work?", AgentRouter.ROUTE_RAG),
+]
+
+# (query, DiagramAgent fails, expected caller, expected error code)
+DELEGATION_CASES = [
+    ("create a flowchart diagram", False, "diagram", None),
+    ("How does authentication work?", False, "rag", None),
+    ("create sequence diagram", True, "diagram", "diagram_generation_error"),
+]
+
+
+class TestAgentRouterIntegration:
+    """Test agent router integration with DiagramAgent"""
+
+    def test_default_initialization(self, router, mock_rag_agent, mock_diagram_agent):
+        """Test that the router falls back to the default config"""
+        assert router.agent_config is not None
+        assert router.rag_agent is mock_rag_agent
+        assert router.diagram_agent is mock_diagram_agent
+
+    def test_initialization_with_config(self, mock_rag_agent, mock_diagram_agent):
+        """Test that the router stores a copy of the given config"""
+        config = get_agent_config("modern")
+
+        router = AgentRouter(mock_rag_agent, mock_diagram_agent, config)
+
+        assert router.agent_config == config
+        assert router.agent_config is not config
+
+    @pytest.mark.parametrize("query,expected", ROUTE_CASES)
+    def test_route_selection(self, router, query, expected):
+        """Test that each query is routed to the expected handler"""
+        assert router._get_route(query) == expected
+
+    def test_diagram_agent_detection_extends_keywords(self, router, mock_diagram_agent):
+        """Test that DiagramAgent can claim queries the routing keywords miss"""
+        mock_diagram_agent.can_handle_request.return_value = True
+
+        assert router._get_route("show how the services talk to each other") == AgentRouter.ROUTE_DIAGRAM
+        mock_diagram_agent.can_handle_request.assert_called_once_with("show how the services talk to each other")
+
+    @pytest.mark.parametrize("query,agent_fails,expected_caller,expected_error", DELEGATION_CASES)
+    def test_route_query_paths(self, router, mock_rag_agent, mock_diagram_agent,
+                               query, agent_fails, expected_caller, expected_error):
+        """Test delegation to DiagramAgent, to the RAG agent and the DiagramAgent failure path"""
+        if agent_fails:
+            mock_diagram_agent.process_query.side_effect = Exception("Agent failed")
+        caller, other = ((mock_diagram_agent, mock_rag_agent) if expected_caller == "diagram"
+                         else (mock_rag_agent, mock_diagram_agent))
+
+        response = router.route_query(query)
+
+        caller.process_query.assert_called_once_with(query)
+        other.process_query.assert_not_called()
+        if expected_error:
+            assert response.status == ResponseStatus.ERROR
+            assert response.error_code == expected_error
+            assert "Agent failed" in response.answer
+        else:
+            canned = caller.process_query.return_value
+            assert response.is_success()
+            assert response.answer == canned["answer"]
+            assert response.mermaid_code == canned.get("mermaid_code")
+            expected_type = ResponseType.DIAGRAM if expected_caller == "diagram" else ResponseType.TEXT
+            assert response.response_type == expected_type
+
+    def test_diagram_query_without_diagram_agent(self, mock_rag_agent):
+        """Test graceful degradation when DiagramAgent is missing"""
+        router = AgentRouter(mock_rag_agent, None)
+
+        response = router.route_query("create complex flowchart")
+
+        assert response.status == ResponseStatus.ERROR
+        assert response.error_code == "diagram_agent_unavailable"
+        mock_rag_agent.process_query.assert_not_called()
+
+    def test_configuration_validation(self, mock_rag_agent):
+        """Test that a validated config falls back to DiagramHandler without DiagramAgent"""
+        config = get_agent_config("modern").validate_for_router(diagram_agent_available=False)
+
+        router = AgentRouter(mock_rag_agent, None, config)
+
+        assert router.agent_config.routing.preferred_diagram_agent == DiagramAgentType.DIAGRAM_HANDLER
+        assert get_agent_config("modern").routing.preferred_diagram_agent == DiagramAgentType.DIAGRAM_AGENT
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
@@ -0,0 +1,31 @@
+"""
+Tests for the Chroma vector store
+"""
+
+from unittest.mock import Mock, create_autospec, patch
+
+import chromadb
+from chromadb.api import ClientAPI
+
+from src.vectorstores import chroma_store
+from src.vectorstores.chroma_store import ChromaStore
+
+
+def test_injected_client_is_reused():
+    """Test that an injected client is used instead of building a Chroma client"""
+    client = create_autospec(ClientAPI, instance=True)
+
+    with patch.object(chromadb, "HttpClient") as http_client, \
+            patch.object(chromadb, "PersistentClient") as persistent_client, \
+            patch.object(chroma_store, "Chroma") as chroma:
+        store = ChromaStore(collection_name="test-collection", embedding_function=Mock(), client=client)
+
+    http_client.assert_not_called()
+    persistent_client.assert_not_called()
+    assert store.client is client
+    client.get_collection.assert_called_once_with("test-collection")
+    chroma.assert_called_once_with(
+        client=client,
+        collection_name="test-collection",
+        embedding_function=store.embedding_function
+    )
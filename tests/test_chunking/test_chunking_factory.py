@@ -3,22 +3,48 @@ Tests for the chunking factory.
 """
 
 import unittest
-from unittest.mock import patch, MagicMock
 from langchain.docstore.document import Document
 
-# Import from the source
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.processors.chunking import ChunkingFactory, FallbackChunker, PythonChunker, CSharpChunker
 
 
+PYTHON_SAMPLE = '''
+def hello_world():
+    """A simple hello world function."""
+    print("Hello, world!")
+
+class TestClass:
+    """A test class."""
+    
+    def __init__(self):
+        self.value = 42
+    
+    def get_value(self):
+        return self.value
+'''
+
+
 class TestChunkingFactory(unittest.TestCase):
     """Tests for ChunkingFactory class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the chunkers and a pre-registered factory once for the class."""
+        cls._py_chunker = PythonChunker()
+        cls._cs_chunker = CSharpChunker()
+        cls._prebuilt = ChunkingFactory()
+        cls._prebuilt.register_chunker(cls._py_chunker)
+        cls._prebuilt.register_chunker(cls._cs_chunker)
+        
+        # Input document shared by tests that only inspect the produced chunks
+        cls._python_doc = Document(
+            page_content=PYTHON_SAMPLE,
+            metadata={"file_path": "test.py", "file_type": ".py", "source": "test"}
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
+        # Fresh factory for tests that inspect or mutate registration state
         self.factory = ChunkingFactory()
     
     def test_factory_initialization(self):
@@ -28,8 +54,7 @@ class TestChunkingFactory(unittest.TestCase):
     
     def test_register_chunker(self):
         """Test registering a chunker."""
-        python_chunker = PythonChunker()
-        self.factory.register_chunker(python_chunker)
+        self.factory.register_chunker(self._py_chunker)
         
         # Check that Python extensions are registered
         supported_extensions = self.factory.get_supported_extensions()
@@ -37,20 +62,12 @@ class TestChunkingFactory(unittest.TestCase):
     
     def test_get_chunker_python(self):
         """Test getting Python chunker."""
-        python_chunker = PythonChunker()
-        self.factory.register_chunker(python_chunker)
-        
-        # Test Python file
-        chunker = self.factory.get_chunker('test.py')
+        chunker = self._prebuilt.get_chunker('test.py')
         self.assertIsInstance(chunker, PythonChunker)
     
     def test_get_chunker_csharp(self):
         """Test getting C# chunker."""
-        csharp_chunker = CSharpChunker()
-        self.factory.register_chunker(csharp_chunker)
-        
-        # Test C# file
-        chunker = self.factory.get_chunker('test.cs')
+        chunker = self._prebuilt.get_chunker('test.cs')
         self.assertIsInstance(chunker, CSharpChunker)
     
     def test_get_chunker_fallback(self):
@@ -66,32 +83,7 @@ class TestChunkingFactory(unittest.TestCase):
     
     def test_chunk_documents_with_python(self):
         """Test chunking Python documents."""
-        python_chunker = PythonChunker()
-        self.factory.register_chunker(python_chunker)
-        
-        # Create test document
-        python_code = '''
-def hello_world():
-    """A simple hello world function."""
-    print("Hello, world!")
-
-class TestClass:
-    """A test class."""
-    
-    def __init__(self):
-        self.value = 42
-    
-    def get_value(self):
-        return self.value
-'''
-        
-        doc = Document(
-            page_content=python_code,
-            metadata={"file_path": "test.py", "file_type": ".py", "source": "test"}
-        )
-        
-        # Test chunking
-        chunks = self.factory.chunk_documents([doc])
+        chunks = self._prebuilt.chunk_documents([self._python_doc])
         
         # Should create multiple chunks for different elements
         self.assertGreater(len(chunks), 0)
@@ -104,13 +96,7 @@ class TestClass:
     
     def test_get_chunker_info(self):
         """Test getting chunker information."""
-        python_chunker = PythonChunker()
-        csharp_chunker = CSharpChunker()
-        
-        self.factory.register_chunker(python_chunker)
-        self.factory.register_chunker(csharp_chunker)
-        
-        info = self.factory.get_chunker_info()
+        info = self._prebuilt.get_chunker_info()
         
         self.assertIn("PythonChunker", info)
         self.assertIn("CSharpChunker", info)
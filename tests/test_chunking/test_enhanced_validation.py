@@ -6,11 +6,6 @@ import unittest
 from unittest.mock import patch, MagicMock
 from langchain.docstore.document import Document
 
-# Import from the source
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-
 from src.processors.text_processor import TextProcessor
 from src.processors.chunking import PythonChunker, CSharpChunker, FallbackChunker
 
@@ -289,6 +284,47 @@ namespace ComplexExample.Services
             self.assertIn("chunk_type", chunk.metadata)
             self.assertIn("contains_documentation", chunk.metadata)
     
+    def test_csharp_small_types_keep_own_chunks(self):
+        """Test that small adjacent C# types are not merged while usings are."""
+        csharp_code = '''
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace Shop.Models
+{
+    public class Customer
+    {
+        public string Name { get; set; }
+    }
+
+    public class Order
+    {
+        public int Id { get; set; }
+    }
+
+    public enum OrderStatus
+    {
+        Pending,
+        Shipped
+    }
+}
+'''
+        
+        doc = Document(
+            page_content=csharp_code,
+            metadata={"file_path": "Models.cs", "file_type": ".cs", "source": "test"}
+        )
+        
+        chunks = CSharpChunker(use_advanced_parsing=True).chunk_document(doc)
+        
+        # One chunk for the usings, then one per type with its own symbol name
+        self.assertEqual(
+            [(chunk.metadata.get("chunk_type"), chunk.metadata.get("symbol_name")) for chunk in chunks],
+            [("using", "System"), ("class", "Customer"), ("class", "Order"), ("enum", "OrderStatus")]
+        )
+        self.assertEqual(chunks[0].metadata.get("element_types"), ["using", "using", "using"])
+    
     def test_empty_document_handling(self):
         """Test handling of empty documents."""
         empty_doc = Document(
@@ -543,6 +579,26 @@ def utility_function_{i}(data: List[Dict]) -> Dict:
         # Should preserve most content (allowing for some formatting differences)
         self.assertGreater(total_chunked, total_original * 0.9)
 
+    def test_iter_process_documents_matches_process_documents(self):
+        """Test that streaming in batches yields the same chunks, one list per batch."""
+        def make_documents():
+            return [
+                Document(
+                    page_content=f'def function_{i}():\n    """Function {i}."""\n    return {i}\n',
+                    metadata={"file_path": f"module_{i}.py", "file_type": ".py", "source": "test"}
+                )
+                for i in range(20)
+            ]
+
+        sequential_chunks = self.enhanced_processor.process_documents(make_documents())
+
+        batches = list(self.enhanced_processor.iter_process_documents(make_documents(), batch_size=8))
+        self.assertEqual(len(batches), 3)
+        self.assertEqual(
+            [(c.page_content, c.metadata.get("file_path")) for batch in batches for c in batch],
+            [(c.page_content, c.metadata.get("file_path")) for c in sequential_chunks]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
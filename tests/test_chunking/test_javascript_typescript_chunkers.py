@@ -2,7 +2,9 @@
 Tests for JavaScript and TypeScript chunkers.
 """
 
+import threading
 import unittest
+from unittest.mock import patch
 from langchain.docstore.document import Document
 from src.processors.chunking.javascript_chunker import JavaScriptChunker
 from src.processors.chunking.typescript_chunker import TypeScriptChunker
@@ -22,6 +24,30 @@ class TestJavaScriptChunker(unittest.TestCase):
         self.assertIn('.js', self.chunker.get_supported_extensions())
         self.assertIn('.jsx', self.chunker.get_supported_extensions())
     
+    def test_javascript_parser_reused_across_threads(self):
+        """Test that chunking on separate threads reuses one pooled tree-sitter parser."""
+        parser = self.chunker.advanced_parser
+        acquire_parser = parser._acquire_parser
+        acquired = []
+        
+        def record_acquire():
+            acquired.append(acquire_parser())
+            return acquired[-1]
+        
+        doc = Document(
+            page_content="function add(a, b) {\n    return a + b;\n}\n",
+            metadata={"file_path": "add.js", "file_type": ".js", "source": "test"}
+        )
+        
+        with patch.object(parser, '_acquire_parser', side_effect=record_acquire):
+            for _ in range(2):
+                thread = threading.Thread(target=self.chunker.chunk_document, args=(doc,))
+                thread.start()
+                thread.join()
+        
+        self.assertEqual(len(acquired), 2)
+        self.assertIs(acquired[0], acquired[1])
+    
     def test_javascript_import_export_chunking(self):
         """Test chunking of JavaScript import/export statements."""
         js_code = '''
@@ -141,6 +167,62 @@ async function fetchData(url) {
         for chunk in chunks:
             self.assertEqual(chunk.metadata.get("parsing_method"), "tree-sitter")
 
+    def test_javascript_small_functions_are_merged(self):
+        """Test that adjacent small functions are packed into chunks up to max_chunk_size."""
+        js_code = "\n".join(
+            f"function helper{i}(x) {{\n    return x * {i};\n}}\n" for i in range(30)
+        )
+
+        doc = Document(
+            page_content=js_code,
+            metadata={"file_path": "helpers.js", "file_type": ".js", "source": "test"}
+        )
+
+        chunks = self.chunker.chunk_document(doc)
+
+        # 30 functions of ~50 characters fit in a couple of 1500 character chunks
+        self.assertLess(len(chunks), 5)
+        all_content = " ".join(chunk.page_content for chunk in chunks)
+        for i in range(30):
+            self.assertIn(f"function helper{i}(", all_content)
+        for chunk in chunks:
+            self.assertEqual(chunk.metadata.get("chunk_type"), "function")
+            self.assertLessEqual(len(chunk.page_content), self.chunker.max_chunk_size)
+
+    def test_javascript_small_exports_keep_own_chunks(self):
+        """Test that small adjacent exports are not merged while imports are."""
+        js_code = '''
+import { api } from './api';
+import { log } from './log';
+
+export class Customer {
+    constructor(name) { this.name = name; }
+}
+
+export class Order {
+    constructor(id) { this.id = id; }
+}
+
+export function total(order) {
+    return order.sum;
+}
+'''
+
+        doc = Document(
+            page_content=js_code,
+            metadata={"file_path": "models.js", "file_type": ".js", "source": "test"}
+        )
+
+        chunks = self.chunker.chunk_document(doc)
+
+        # One chunk for the imports, then one per export with its own symbol name
+        self.assertEqual(
+            [(chunk.metadata.get("chunk_type"), chunk.metadata.get("symbol_name")) for chunk in chunks],
+            [("import", "./api"), ("export", "export Customer"), ("export", "export Order"),
+             ("export", "export total")]
+        )
+        self.assertEqual(chunks[0].metadata.get("element_types"), ["import", "import"])
+
 
 class TestTypeScriptChunker(unittest.TestCase):
     """Test cases for TypeScriptChunker."""
@@ -292,6 +374,64 @@ export namespace UserUtils {
         self.assertIn("enum UserStatus", all_content)
         self.assertIn("namespace UserUtils", all_content)
     
+    def test_typescript_small_types_keep_own_chunks(self):
+        """Test that small adjacent exported interfaces and type aliases are not merged."""
+        ts_code = '''
+import { Money } from './money';
+
+export interface Customer {
+    name: string;
+}
+
+export interface Order {
+    id: number;
+}
+
+export type OrderId = number;
+'''
+        
+        doc = Document(
+            page_content=ts_code,
+            metadata={"file_path": "models.ts", "file_type": ".ts", "source": "test"}
+        )
+        
+        chunks = self.chunker.chunk_document(doc)
+        
+        # One chunk for the import, then one per exported type
+        self.assertEqual(
+            [(chunk.metadata.get("chunk_type"), chunk.page_content) for chunk in chunks],
+            [
+                ("import", "import { Money } from './money';"),
+                ("export", "export interface Customer {\n    name: string;\n}"),
+                ("export", "export interface Order {\n    id: number;\n}"),
+                ("export", "export type OrderId = number;"),
+            ]
+        )
+    
+    def test_typescript_declare_check_keeps_source_cache(self):
+        """Test that ambient checks slice the parsed source without replacing its cached bytes."""
+        parser = self.chunker.advanced_parser
+        ts_code = 'declare module "shop" {\n    interface Customer { name: string; }\n}\n\n// Überblick\ninterface Order { id: number; }\n'
+        
+        result = parser.parse(ts_code, "shop.ts")
+        cached_source, cached_bytes = parser._encoded_source
+        self.assertIs(cached_source, ts_code)
+        
+        # Slicing some other text leaves the parsed source's encoding in place
+        self.assertEqual(parser._slice_source("declare const x;", 0, 7), "declare")
+        self.assertIs(parser._encoded_source[0], ts_code)
+        self.assertIs(parser._encoded_source[1], cached_bytes)
+        
+        # A file opening with 'declare' does not make its other top-level interfaces ambient
+        order = next(e for e in result.elements if e.name == "Order")
+        self.assertFalse(order.language_specific["is_declared"])
+        
+        # An interface inside the ambient module is declared
+        module = result.tree_objects.root_node.children[0]
+        customer = module.children[1].children[2].children[1]
+        self.assertEqual(customer.type, "interface_declaration")
+        self.assertTrue(parser._is_declared(customer, ts_code))
+    
     def test_typescript_fallback_to_javascript(self):
         """Test fallback to JavaScript parsing when TypeScript parsing fails."""
         # Create a chunker that will fail TypeScript parsing
@@ -1,17 +1,32 @@
 import pytest
 from src.config.settings import Settings
+from src.config.agent_config import AGENT_CONFIG_PRESETS, get_agent_config
 
-def test_settings_initialization():
+@pytest.fixture(scope="module")
+def settings():
+    """Settings built once for the module; the tests only read defaults"""
+    return Settings()
+
+def test_settings_initialization(settings):
     """Test that settings can be initialized"""
-    settings = Settings()
     assert settings.chunk_size == 1000
     assert settings.chunk_overlap == 200
     assert settings.api_host == "0.0.0.0"
     assert settings.api_port == 8000
 
-def test_settings_environment_defaults():
+def test_settings_environment_defaults(settings):
     """Test default values"""
-    settings = Settings()
     assert settings.chroma_host == "localhost"
     assert settings.chroma_port == 8000
     assert settings.temperature == 0.7
+
+def test_get_agent_config_presets():
+    """Test that agent config presets are looked up by name"""
+    config = get_agent_config("legacy")
+    assert config == AGENT_CONFIG_PRESETS["legacy"]
+
+    # Each call returns a copy, so mutating it leaves the shared preset alone
+    config.routing.enable_agent_fallback = not config.routing.enable_agent_fallback
+    assert config != AGENT_CONFIG_PRESETS["legacy"]
+    with pytest.raises(ValueError):
+        get_agent_config("unknown")
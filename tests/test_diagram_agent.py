@@ -8,31 +8,36 @@ including semantic analysis, repository filtering, and code pattern detection.
 import unittest
 from unittest.mock import Mock, MagicMock, patch
 from langchain.docstore.document import Document
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.vectorstores import VectorStore
 from src.agents.diagram_agent import DiagramAgent
+from src.agents.query_optimizer import AdvancedQueryOptimizer
+from src.agents.response_quality_enhancer import EnhancedResponseQualityEnhancer
 from src.utils.code_pattern_detector import CodePatternDetector, QueryOptimizer, RepositoryFilter
 
 
 class TestEnhancedCodeRetrieval(unittest.TestCase):
     """Test enhanced code retrieval functionality"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        # Mock dependencies
-        self.mock_vectorstore = Mock()
-        self.mock_llm = Mock()
-        self.mock_query_optimizer = Mock()
-        self.mock_response_enhancer = Mock()
-        
-        # Create DiagramAgent instance
-        self.agent = DiagramAgent(
-            vectorstore=self.mock_vectorstore,
-            llm=self.mock_llm,
-            query_optimizer=self.mock_query_optimizer,
-            response_enhancer=self.mock_response_enhancer
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in the class"""
+        # Mock dependencies, specced so only their real attributes exist
+        cls.mock_vectorstore = Mock(spec=VectorStore)
+        cls.mock_llm = Mock(spec=BaseLanguageModel)
+        cls.mock_query_optimizer = Mock(spec=AdvancedQueryOptimizer)
+        cls.mock_response_enhancer = Mock(spec=EnhancedResponseQualityEnhancer)
+        
+        # Create DiagramAgent instance once; it keeps no per-query state
+        cls.agent = DiagramAgent(
+            vectorstore=cls.mock_vectorstore,
+            llm=cls.mock_llm,
+            query_optimizer=cls.mock_query_optimizer,
+            response_enhancer=cls.mock_response_enhancer
         )
         
         # Sample test documents
-        self.sample_docs = [
+        cls.sample_docs = [
             Document(
                 page_content="class UserService:\n    def get_user(self, user_id):\n        return self.repository.find(user_id)",
                 metadata={'file_type': 'py', 'repository': 'user-management', 'file_path': 'services/user_service.py'}
@@ -46,6 +51,26 @@ class TestEnhancedCodeRetrieval(unittest.TestCase):
                 metadata={'file_type': 'cs', 'repository': 'user-management', 'file_path': 'models/User.cs'}
             )
         ]
+        
+        # Vector store results per search query; unknown queries find nothing
+        cls._search_table = {
+            "user repository:user-management": cls.sample_docs[:2],  # Repository search
+            "user sequence diagram": cls.sample_docs[:2],            # Intent search
+            "user": [cls.sample_docs[2]],                            # General search
+            "function": [cls.sample_docs[0]],                        # Pattern search
+        }
+    
+    def setUp(self):
+        """Clear calls, return values and side effects left on the shared mocks"""
+        for mock in (self.mock_vectorstore, self.mock_llm,
+                     self.mock_query_optimizer, self.mock_response_enhancer):
+            mock.reset_mock(return_value=True, side_effect=True)
+        
+        self.mock_vectorstore.similarity_search.side_effect = self._fake_similarity_search
+    
+    def _fake_similarity_search(self, query, k=4):
+        """Answer vector store searches from the search table, independent of call order"""
+        return self._search_table.get(query, [])
     
     def test_enhanced_query_optimization(self):
         """Test enhanced query optimization for diagrams"""
@@ -123,21 +148,16 @@ class TestEnhancedCodeRetrieval(unittest.TestCase):
         self.assertNotIn("a", terms)
         self.assertNotIn("for", terms)
     
+    # The search helpers moved from DiagramAgent to its EnhancedCodeRetriever, so these
+    # tests call them on agent.code_retriever; they failed while still calling the agent
+    
     def test_multi_strategy_search(self):
         """Test multi-strategy search implementation"""
-        # Mock vectorstore responses
-        self.mock_vectorstore.similarity_search.side_effect = [
-            [self.sample_docs[0]],  # Repository search
-            [self.sample_docs[1]],  # Intent search
-            [self.sample_docs[2]],  # General search
-            [self.sample_docs[0]]   # Pattern search
-        ]
-        
         search_terms = ["user", "service"]
         repositories = ["user-management"]
         intent = {'preferred_type': 'sequence', 'confidence': 0.8}
         
-        results = self.agent._multi_strategy_search(search_terms, repositories, intent)
+        results = self.agent.code_retriever._multi_strategy_search(search_terms, repositories, intent)
         
         # Should combine results from all strategies
         self.assertGreater(len(results), 0)
@@ -145,10 +165,7 @@ class TestEnhancedCodeRetrieval(unittest.TestCase):
     
     def test_repository_specific_search(self):
         """Test repository-specific search with context"""
-        # Mock repository search
-        self.mock_vectorstore.similarity_search.return_value = self.sample_docs[:2]
-        
-        results = self.agent._search_repository_with_context(
+        results = self.agent.code_retriever._search_repository_with_context(
             "user-management", ["user", "service"], 
             {'preferred_type': 'sequence'}
         )
@@ -164,10 +181,7 @@ class TestEnhancedCodeRetrieval(unittest.TestCase):
         intent = {'preferred_type': 'sequence'}
         search_terms = ["user", "service"]
         
-        # Mock intent-based search
-        self.mock_vectorstore.similarity_search.return_value = self.sample_docs[:2]
-        
-        results = self.agent._search_by_diagram_intent(search_terms, intent)
+        results = self.agent.code_retriever._search_by_diagram_intent(search_terms, intent)
         
         # Should add diagram-specific terms
         self.assertGreater(len(results), 0)
@@ -319,23 +333,29 @@ class TestEnhancedCodeRetrieval(unittest.TestCase):
 class TestCodeAnalysisUtilities(unittest.TestCase):
     """Test individual code analysis utility classes"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the utilities once; they keep no state between calls"""
+        cls.detector = CodePatternDetector()
+        cls.optimizer = QueryOptimizer()
+        cls.repository_filter = RepositoryFilter()
+        
+        cls.pattern_docs = [
+            # Python code with class patterns
+            Document(
+                page_content="class UserService:\n    def get_user(self, user_id):\n        return self.repository.find(user_id)",
+                metadata={'file_type': 'py', 'file_path': 'user_service.py'}
+            ),
+            # JavaScript code with function patterns
+            Document(
+                page_content="function processUser(userId) { if (userId) { return userService.getUser(userId); } }",
+                metadata={'file_type': 'js', 'file_path': 'user_processor.js'}
+            )
+        ]
+    
     def test_pattern_detector_pattern_detection(self):
         """Test pattern detection for different diagram types"""
-        detector = CodePatternDetector()
-        
-        # Test Python code with class patterns
-        python_doc = Document(
-            page_content="class UserService:\n    def get_user(self, user_id):\n        return self.repository.find(user_id)",
-            metadata={'file_type': 'py', 'file_path': 'user_service.py'}
-        )
-        
-        # Test JavaScript code with function patterns
-        js_doc = Document(
-            page_content="function processUser(userId) { if (userId) { return userService.getUser(userId); } }",
-            metadata={'file_type': 'js', 'file_path': 'user_processor.js'}
-        )
-        
-        structure = detector.detect_patterns([python_doc, js_doc])
+        structure = self.detector.detect_patterns(self.pattern_docs)
         
         # Should detect classes and functions
         self.assertGreater(len(structure.classes), 0)
@@ -349,7 +369,7 @@ class TestCodeAnalysisUtilities(unittest.TestCase):
     
     def test_query_optimizer_diagram_keywords(self):
         """Test query optimization for different diagram types"""
-        optimizer = QueryOptimizer()
+        optimizer = self.optimizer
         
         # Test query that should get enhanced (no diagram keywords)
         query = "show me the user management"
@@ -368,7 +388,7 @@ class TestCodeAnalysisUtilities(unittest.TestCase):
     
     def test_repository_filter_patterns(self):
         """Test repository filtering patterns"""
-        filter_obj = RepositoryFilter()
+        filter_obj = self.repository_filter
         
         # Test various repository patterns
         test_cases = [
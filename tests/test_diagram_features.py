@@ -8,6 +8,24 @@ from src.agents.agent_router import AgentRouter
 from src.processors.sequence_detector import SequenceDetector
 
 
+DIAGRAM_QUESTIONS = [
+    "Show me a sequence diagram for user authentication",
+    "Generate a flow diagram for the payment process",
+    "Create a sequence diagram for order processing",
+    "Visualize how the authentication system works",
+    "Show me how data flows through the API",
+    "Generate mermaid code for the checkout process"
+]
+
+REGULAR_QUESTIONS = [
+    "How does the authentication middleware work?",
+    "What are the available API endpoints?",
+    "Explain the database schema design",
+    "How do I set up the development environment?",
+    "What are the deployment requirements?"
+]
+
+
 class TestAgentRouter:
     """Test agent routing functionality"""
     
@@ -25,32 +43,15 @@ class TestAgentRouter:
         
         self.agent_router = AgentRouter(self.mock_rag_agent, self.mock_diagram_agent)
     
-    def test_diagram_request_detection(self):
+    @pytest.mark.parametrize("question", DIAGRAM_QUESTIONS)
+    def test_diagram_request_detection(self, question):
         """Test that diagram requests are properly detected"""
-        diagram_questions = [
-            "Show me a sequence diagram for user authentication",
-            "Generate a flow diagram for the payment process",
-            "Create a sequence diagram for order processing",
-            "Visualize how the authentication system works",
-            "Show me how data flows through the API",
-            "Generate mermaid code for the checkout process"
-        ]
-        
-        for question in diagram_questions:
-            assert self.agent_router._is_diagram_request(question), f"Failed to detect diagram request: {question}"
+        assert self.agent_router._is_diagram_request(question), f"Failed to detect diagram request: {question}"
     
-    def test_regular_request_detection(self):
+    @pytest.mark.parametrize("question", REGULAR_QUESTIONS)
+    def test_regular_request_detection(self, question):
         """Test that regular questions are not detected as diagram requests"""
-        regular_questions = [
-            "How does the authentication middleware work?",
-            "What are the available API endpoints?", 
-            "Explain the database schema design",
-            "How do I set up the development environment?",
-            "What are the deployment requirements?"
-        ]
-        
-        for question in regular_questions:
-            assert not self.agent_router._is_diagram_request(question), f"Incorrectly detected as diagram request: {question}"
+        assert not self.agent_router._is_diagram_request(question), f"Incorrectly detected as diagram request: {question}"
     
     def test_rag_agent_routing(self):
         """Test routing to RAG agent for regular queries"""
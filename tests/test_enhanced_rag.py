@@ -12,6 +12,28 @@ from langchain.docstore.document import Document
 from src.agents.rag_agent import RAGAgent, QueryAnalysis, QueryAnalyzer, ContextRefiner, ResponseEnhancer
 from src.config.rag_enhancement_config import RAGEnhancementConfig, get_enhancement_config
 
+# (question, expected intent)
+INTENT_CASES = [
+    ("How does the main function work?", "code_analysis"),
+    ("What are the config settings?", "configuration"),
+    ("What is this project about?", "general"),
+]
+
+# (question, expected complexity)
+COMPLEXITY_CASES = [
+    ("What is Python?", "low"),
+    ("How does the authentication system work?", "medium"),
+    ("Analyze the architecture and optimize the performance", "high"),
+]
+
+# (intent, complexity, expected strategy): high complexity wins over the intent
+STRATEGY_CASES = [
+    ("code_analysis", "high", "multi_pass"),
+    ("code_analysis", "medium", "code_focused"),
+    ("configuration", "medium", "config_focused"),
+    ("general", "low", "standard"),
+]
+
 class TestQueryAnalysis:
     """Test QueryAnalysis class"""
     
@@ -41,33 +63,15 @@ class TestQueryAnalyzer:
         self.mock_llm = Mock()
         self.analyzer = QueryAnalyzer(self.mock_llm)
     
-    def test_intent_classification(self):
+    @pytest.mark.parametrize("question,expected_intent", INTENT_CASES)
+    def test_intent_classification(self, question, expected_intent):
         """Test query intent classification"""
-        # Test code analysis intent
-        intent = self.analyzer._classify_intent("How does the main function work?")
-        assert intent == "code_analysis"
-        
-        # Test configuration intent
-        intent = self.analyzer._classify_intent("What are the config settings?")
-        assert intent == "configuration"
-        
-        # Test general intent
-        intent = self.analyzer._classify_intent("What is this project about?")
-        assert intent == "general"
+        assert self.analyzer._classify_intent(question) == expected_intent
     
-    def test_complexity_assessment(self):
+    @pytest.mark.parametrize("question,expected_complexity", COMPLEXITY_CASES)
+    def test_complexity_assessment(self, question, expected_complexity):
         """Test query complexity assessment"""
-        # Test low complexity
-        complexity = self.analyzer._assess_complexity("What is Python?")
-        assert complexity == "low"
-        
-        # Test medium complexity
-        complexity = self.analyzer._assess_complexity("How does the authentication system work?")
-        assert complexity == "medium"
-        
-        # Test high complexity
-        complexity = self.analyzer._assess_complexity("Analyze the architecture and optimize the performance")
-        assert complexity == "high"
+        assert self.analyzer._assess_complexity(question) == expected_complexity
     
     def test_query_optimization(self):
         """Test query optimization"""
@@ -84,23 +88,10 @@ class TestQueryAnalyzer:
         optimized = self.analyzer._optimize_query("What is this?", "general")
         assert optimized == "What is this?"
     
-    def test_retrieval_strategy_selection(self):
+    @pytest.mark.parametrize("intent,complexity,expected_strategy", STRATEGY_CASES)
+    def test_retrieval_strategy_selection(self, intent, complexity, expected_strategy):
         """Test retrieval strategy selection"""
-        # Test high complexity -> multi_pass
-        strategy = self.analyzer._select_retrieval_strategy("code_analysis", "high")
-        assert strategy == "multi_pass"
-        
-        # Test code analysis -> code_focused
-        strategy = self.analyzer._select_retrieval_strategy("code_analysis", "medium")
-        assert strategy == "code_focused"
-        
-        # Test configuration -> config_focused
-        strategy = self.analyzer._select_retrieval_strategy("configuration", "medium")
-        assert strategy == "config_focused"
-        
-        # Test general -> standard
-        strategy = self.analyzer._select_retrieval_strategy("general", "low")
-        assert strategy == "standard"
+        assert self.analyzer._select_retrieval_strategy(intent, complexity) == expected_strategy
     
     def test_full_analysis(self):
         """Test complete query analysis"""